@@ -1,26 +1,63 @@
 """The Aqara Camera G3 integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from datetime import datetime, timedelta
+import time
+from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, webhook
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, SERVICE_REFRESH_FACE_LIST
+from .const import (
+    CONF_AQARA_URL,
+    CONF_PUSH_MODE,
+    CONF_WEBHOOK_ID,
+    DOMAIN,
+    SERVICE_GET_STATE,
+    SERVICE_QUERY_EVENTS,
+    SERVICE_REFRESH_FACE_LIST,
+    SERVICE_SET_RESOURCES,
+    SETTINGS_ATTRS,
+    STATUS_ATTRS,
+)
 from .coordinator import AqaraG3DataUpdateCoordinator
+from .models import EVENT_TYPES
+from .ratelimit import async_apply_rate_limit
+from .webhook import async_register_webhook, async_unregister_webhook
 
 _LOGGER = logging.getLogger(__name__)
 
+# Cameras written in parallel by the set_resources service
+SET_RESOURCES_CONCURRENCY = 4
+
+QUERY_EVENTS_LIMIT = 100
+QUERY_EVENTS_MAX_LIMIT = 1000
+JOURNAL_PRUNE_INTERVAL = timedelta(hours=24)
+
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
     Platform.SWITCH,
     Platform.BINARY_SENSOR,
     Platform.BUTTON,
+    Platform.CAMERA,
 ]
 
 
@@ -68,31 +105,262 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         _handle_refresh_face_list,
         schema=vol.Schema({vol.Optional("entry_id"): str}),
     )
+
+    async def _handle_set_resources(call: ServiceCall) -> ServiceResponse:
+        """Write the same resource attrs to several cameras at once."""
+        coordinators = _get_coordinators(hass, call.data.get("entry_id"))
+        resources = {
+            attr: int(value) if isinstance(value, bool) else value
+            for attr, value in call.data["resources"].items()
+        }
+        semaphore = asyncio.Semaphore(SET_RESOURCES_CONCURRENCY)
+
+        async def _write(coordinator: AqaraG3DataUpdateCoordinator) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    values = await coordinator.async_write_resources(resources)
+                except Exception as err:  # pylint: disable=broad-except
+                    _LOGGER.warning(
+                        "Failed to write resources for %s: %s",
+                        coordinator.config_entry.title,
+                        err,
+                    )
+                    return {"success": False, "error": str(err)}
+            return {"success": True, "resources": values}
+
+        results = await asyncio.gather(
+            *(_write(coordinator) for coordinator in coordinators.values())
+        )
+        return {"results": dict(zip(coordinators, results))}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_RESOURCES,
+        _handle_set_resources,
+        schema=vol.Schema(
+            {
+                vol.Optional("entry_id"): vol.All(cv.ensure_list, [str]),
+                vol.Required("resources"): vol.All(
+                    {vol.In(STATUS_ATTRS + SETTINGS_ATTRS): vol.Any(bool, int, str)},
+                    vol.Length(min=1),
+                ),
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def _handle_get_state(call: ServiceCall) -> ServiceResponse:
+        """Return the cached state of one or all cameras."""
+        coordinators = _get_coordinators(hass, call.data.get("entry_id"))
+        max_age = call.data.get("max_age")
+        snapshots = await asyncio.gather(
+            *(
+                coordinator.async_get_snapshot(max_age)
+                for coordinator in coordinators.values()
+            )
+        )
+        now = time.monotonic()
+        return {
+            "cameras": {
+                entry_id: {
+                    "title": coordinator.config_entry.title,
+                    "age": round(now - snapshot.fetched_at, 1),
+                    "lane_ages": {
+                        name: round(now - lane.data.fetched_at, 1)
+                        for name, lane in coordinator.lanes.items()
+                        if lane.data is not None
+                    },
+                    "face_active": coordinator.face_active,
+                    "watchdog_aborts": coordinator.watchdog_aborts,
+                    "state": snapshot.as_dict(),
+                }
+                for (entry_id, coordinator), snapshot in zip(
+                    coordinators.items(), snapshots
+                )
+            }
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_STATE,
+        _handle_get_state,
+        schema=vol.Schema(
+            {
+                vol.Optional("entry_id"): vol.All(cv.ensure_list, [str]),
+                vol.Optional("max_age"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def _handle_query_events(call: ServiceCall) -> ServiceResponse:
+        """Return journaled events matching the filters, newest first."""
+        coordinators = _get_coordinators(hass, call.data.get("entry_id"))
+        if not coordinators:
+            return {"events": []}
+        journal = next(iter(coordinators.values())).journal
+        person = call.data.get("person")
+        if person and (state := hass.states.get(person)) is not None:
+            # Events store the person's display name
+            person = state.name
+        events = await journal.async_query(
+            cameras=coordinators,
+            start_ts=_to_ms(call.data.get("start")),
+            end_ts=_to_ms(call.data.get("end")),
+            person=person,
+            face_id=call.data.get("face_id"),
+            event_type=call.data.get("event_type"),
+            limit=call.data["limit"],
+        )
+        return {
+            "events": [
+                {
+                    "entry_id": event.camera,
+                    "camera": coordinators[event.camera].config_entry.title,
+                    "type": event.event_type,
+                    "time": dt_util.utc_from_timestamp(event.ts / 1000).isoformat(),
+                    "face_id": event.face_id,
+                    "face_name": event.face_name,
+                    "person": event.person,
+                }
+                for event in events
+            ]
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_EVENTS,
+        _handle_query_events,
+        schema=vol.Schema(
+            {
+                vol.Optional("entry_id"): vol.All(cv.ensure_list, [str]),
+                vol.Optional("start"): cv.datetime,
+                vol.Optional("end"): cv.datetime,
+                vol.Optional("person"): cv.string,
+                vol.Optional("face_id"): cv.string,
+                vol.Optional("event_type"): vol.In(EVENT_TYPES),
+                vol.Optional("limit", default=QUERY_EVENTS_LIMIT): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=QUERY_EVENTS_MAX_LIMIT)
+                ),
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
     return True
 
 
+def _to_ms(value: datetime | None) -> int | None:
+    """Convert a service datetime, local if naive, to a ms timestamp."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return int(value.timestamp() * 1000)
+
+
+@callback
+def _get_coordinators(
+    hass: HomeAssistant, entry_ids: list[str] | None
+) -> dict[str, AqaraG3DataUpdateCoordinator]:
+    """Return the coordinators of the given entries, or of all entries."""
+    coordinators = {
+        entry_id: data["coordinator"]
+        for entry_id, data in hass.data.get(DOMAIN, {}).items()
+        if isinstance(data, dict) and data.get("coordinator")
+    }
+    if not entry_ids:
+        return coordinators
+    if missing := [entry_id for entry_id in entry_ids if entry_id not in coordinators]:
+        raise ServiceValidationError(
+            f"Aqara G3 entries not loaded: {', '.join(missing)}"
+        )
+    return {entry_id: coordinators[entry_id] for entry_id in entry_ids}
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Aqara Camera G3 from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     
+    async_apply_rate_limit(hass, entry.data[CONF_AQARA_URL])
+
     # Create coordinator
     coordinator = AqaraG3DataUpdateCoordinator(hass, entry)
     await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_refresh_lanes()
     
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
     }
 
+    coordinator.async_schedule_polls()
+
     # Forward the setup to the sensor platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    if entry.options.get(CONF_PUSH_MODE):
+        if not entry.data.get(CONF_WEBHOOK_ID):
+            hass.config_entries.async_update_entry(
+                entry,
+                data={**entry.data, CONF_WEBHOOK_ID: webhook.async_generate_id()},
+            )
+        async_register_webhook(hass, entry, coordinator)
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    async def _async_stop(_event: Event) -> None:
+        """Cancel in-flight requests so they do not hold up shutdown."""
+        await coordinator.async_shutdown()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    )
+
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass, coordinator.async_prune_journal, JOURNAL_PRUNE_INTERVAL
+        )
+    )
+    entry.async_create_background_task(
+        hass, coordinator.async_prune_journal(), "aqara_g3_journal_prune"
+    )
+
+    if coordinator.statistics:
+        entry.async_create_background_task(
+            hass,
+            _async_backfill_statistics(coordinator),
+            "aqara_g3_face_statistics_backfill",
+        )
     return True
 
 
+async def _async_backfill_statistics(coordinator: AqaraG3DataUpdateCoordinator) -> None:
+    """Backfill face detection statistics without blocking setup."""
+    try:
+        await coordinator.statistics.async_backfill()
+    except Exception as err:  # pylint: disable=broad-except
+        _LOGGER.warning("Failed to backfill face statistics: %s", err)
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Hot-apply face mapping changes, reload the entry for other options."""
+    coordinator: AqaraG3DataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
+        "coordinator"
+    ]
+    if coordinator.async_apply_options(entry.options):
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    async_unregister_webhook(hass, entry)
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: AqaraG3DataUpdateCoordinator = hass.data[DOMAIN].pop(
+            entry.entry_id
+        )["coordinator"]
+        # Cancel polls and requests now instead of waiting out their timeouts
+        await coordinator.async_shutdown()
 
     return unload_ok
 
@@ -1,21 +1,50 @@
 """API client for Aqara Camera G3."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Any
+import time
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
+from homeassistant.util.json import json_loads
+
 from .const import (
     API_BASE_URL,
+    API_CAMERA_OPERATE,
     API_FACE_INFO,
     API_HISTORY_LOG,
     API_RESOURCE_QUERY,
     API_RESOURCE_WRITE,
+    API_VIEW_DATA_QUERY,
+    FACE_EVENT_RESOURCE_ID,
+    HISTORY_START_TIME,
+    SETTINGS_ATTRS,
+    STATUS_ATTRS,
 )
 
+from .request_queue import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+
+if TYPE_CHECKING:
+    from .latency import LatencyTracker
+    from .ratelimit import TokenBucket
+    from .request_queue import RequestQueue
+
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_TIMEOUT = 10.0
+
+# Idempotent reads that may be sent twice to cut tail latency
+HEDGED_ENDPOINTS = frozenset((API_RESOURCE_QUERY, API_HISTORY_LOG, API_FACE_INFO))
+
+# Encoded request bodies kept per client before the cache is reset
+BODY_CACHE_SIZE = 16
+
 
 class AqaraG3API:
     """API client for Aqara Camera G3."""
@@ -28,21 +57,187 @@ class AqaraG3API:
         appid: str,
         userid: str | None = None,
         subject_id: str | None = None,
+        limiter: TokenBucket | None = None,
+        queue: RequestQueue | None = None,
+        latency: LatencyTracker | None = None,
     ) -> None:
         """Initialize the API client."""
         self._session = session
+        self.limiter = limiter
+        self.queue = queue
+        self.latency = latency
         self._token = token
         self._appid = appid
         self._userid = userid
         self._subject_id = subject_id
         self._base_url = API_BASE_URL.format(url=aqara_url)
+        # Network calls still running, cancelled together on close
+        self._inflight: set[asyncio.Task] = set()
+        self._closed = False
+        # Polls send the same bodies every time, so encode them once
+        self._bodies: dict[Hashable, bytes] = {}
+        # Digest of the last raw response per (endpoint, body)
+        self._digests: dict[tuple[str, bytes], bytes] = {}
+
+    def _encoded_body(
+        self, key: Hashable, build: Callable[[], dict[str, Any]]
+    ) -> bytes:
+        """Return the cached JSON encoding of a request body."""
+        body = self._bodies.get(key)
+        if body is None:
+            if len(self._bodies) >= BODY_CACHE_SIZE:
+                self._bodies.clear()
+            body = json.dumps(build(), separators=(",", ":")).encode()
+            self._bodies[key] = body
+        return body
+
+    @property
+    def inflight(self) -> int:
+        """Return the number of network calls still running."""
+        return len(self._inflight)
+
+    async def async_close(self) -> None:
+        """Cancel every in-flight call and refuse new ones."""
+        self._closed = True
+        tasks = list(self._inflight)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+            _LOGGER.debug("Cancelled %s in-flight Aqara requests", len(tasks))
+
+    async def _tracked(self, call: Awaitable[Any]) -> Any:
+        """Run a network call as a task that async_close can cancel."""
+        if self._closed:
+            if asyncio.iscoroutine(call):
+                call.close()
+            raise ConnectionError("Aqara API client is closed")
+        task = asyncio.ensure_future(call)
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+        return await task
+
+    def _closed_under_caller(self) -> bool:
+        """Return True if a CancelledError came from async_close, not the caller."""
+        current = asyncio.current_task()
+        return self._closed and current is not None and not current.cancelling()
 
     async def _request(
         self,
         method: str,
         endpoint: str,
-        data: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
+        data: dict[str, Any] | bytes | None = None,
+        priority: int = PRIORITY_BACKGROUND,
+        merge: bool = False,
+        skip_unchanged: bool = False,
+    ) -> dict[str, Any] | None:
+        """Make an API request through the account's priority queue.
+
+        data may be a pre-encoded JSON body. With skip_unchanged, a response
+        byte-identical to the last one for the same body returns None.
+        """
+        send = self._send
+        if endpoint.split("?", 1)[0] in HEDGED_ENDPOINTS:
+            send = partial(self._send_hedged, priority=priority)
+
+        merge_key = None
+        if merge:
+            body = data if isinstance(data, bytes) else json.dumps(data, sort_keys=True)
+            # Never join a queued call of lower priority
+            merge_key = (method, endpoint, body, skip_unchanged, priority)
+        try:
+            if self.queue is None:
+                if self.limiter:
+                    await self.limiter.acquire(priority)
+                return await self._tracked(
+                    send(method, endpoint, data, skip_unchanged)
+                )
+            # The queue takes the token before it hands out a slot
+            return await self.queue.run(
+                priority,
+                lambda: self._tracked(send(method, endpoint, data, skip_unchanged)),
+                merge_key,
+                self.limiter,
+            )
+        except asyncio.CancelledError:
+            if self._closed_under_caller():
+                raise ConnectionError("Aqara API client is closed") from None
+            raise
+
+    async def _send_duplicate(
+        self,
+        priority: int,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | bytes | None,
+        skip_unchanged: bool,
+    ) -> dict[str, Any] | None:
+        """Send a hedged duplicate once it has its own token."""
+        if self.limiter:
+            await self.limiter.acquire(priority)
+        return await self._send(method, endpoint, data, skip_unchanged)
+
+    async def _send_hedged(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | bytes | None = None,
+        skip_unchanged: bool = False,
+        priority: int = PRIORITY_BACKGROUND,
+    ) -> dict[str, Any] | None:
+        """Send an idempotent read, racing a duplicate if it runs past p95."""
+        stats = self.latency.get(endpoint, DEFAULT_TIMEOUT) if self.latency else None
+        hedge_delay = stats.hedge_delay if stats else None
+        start = time.monotonic()
+        tasks = [
+            asyncio.ensure_future(self._send(method, endpoint, data, skip_unchanged))
+        ]
+        answered = False
+        try:
+            if hedge_delay is None:
+                return await tasks[0]
+
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if not done:
+                _LOGGER.debug("Hedging %s after %.2fs", endpoint, hedge_delay)
+                tasks.append(
+                    asyncio.ensure_future(
+                        self._send_duplicate(
+                            priority, method, endpoint, data, skip_unchanged
+                        )
+                    )
+                )
+
+            # Take the first successful answer, or the first error if both fail
+            pending = set(tasks)
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        answered = True
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            original_lost = answered and not tasks[0].done()
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            if original_lost and stats:
+                # The original took at least this long; without the sample
+                # the window forgets its slow tail
+                stats.async_record(time.monotonic() - start)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | bytes | None = None,
+        skip_unchanged: bool = False,
+    ) -> dict[str, Any] | None:
         """Make an API request using Home Assistant's shared session."""
         url = f"{self._base_url}{endpoint}"
         
@@ -57,20 +252,43 @@ class AqaraG3API:
         if self._userid:
             headers["Userid"] = self._userid
 
+        stats = self.latency.get(endpoint, DEFAULT_TIMEOUT) if self.latency else None
+        timeout = stats.timeout if stats else DEFAULT_TIMEOUT
+        start = time.monotonic()
         try:
+            body = data if isinstance(data, bytes) else None
             async with self._session.request(
                 method,
                 url,
-                json=data,
+                data=body,
+                json=None if body is not None else data,
                 headers=headers,
-                timeout=aiohttp.ClientTimeout(total=10),
+                timeout=aiohttp.ClientTimeout(total=timeout),
             ) as response:
                 if response.status == 401 or response.status == 403:
                     error_text = await response.text()
                     _LOGGER.error("Authentication failed: %s", error_text)
                     raise PermissionError("Invalid authentication credentials") from None
                 response.raise_for_status()
-                return await response.json()
+                raw = await response.read()
+            if stats:
+                stats.async_record(time.monotonic() - start)
+            if body is None:
+                return json_loads(raw)
+            # Only pre-encoded poll bodies are worth remembering a digest for
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            if skip_unchanged and self._digests.get((endpoint, body)) == digest:
+                return None
+            result = json_loads(raw)
+            self._digests[(endpoint, body)] = digest
+            return result
+        except asyncio.TimeoutError as err:
+            # Count the timeout so the budget grows if the server slows down
+            if stats:
+                stats.async_record(time.monotonic() - start)
+            raise ConnectionError(
+                f"Timeout after {timeout:.1f}s communicating with Aqara API"
+            ) from err
         except PermissionError:
             # Re-raise permission errors as-is
             raise
@@ -81,73 +299,203 @@ class AqaraG3API:
             _LOGGER.error("Client error: %s", err)
             raise ConnectionError(f"Error communicating with Aqara API: {err}") from err
 
-    async def get_device_status(self) -> dict[str, Any]:
-        """Get device status."""
-        payload = {
-            "data": [
-                {
-                    "options": [
-                        "ptz_cruise_enable",
-                        "pets_track_enable",
-                        "humans_track_enable",
-                        "gesture_detect_enable",
-                        "mdtrigger_enable",
-                        "soundtrigger_enable",
-                        "human_detect_enable",
-                        "face_detect_enable",
-                        "pets_detect_enable",
-                        "set_video",
-                        "sdcard_status",
-                        "alarm_status",
-                        "system_volume",
-                        "alarm_bell_index",
-                        "device_night_tip_light",
-                        "cloud_small_video",
-                        "alarm_bell_volume",
-                        "device_wifi_rssi",
-                        "gateway_deletion_setting",
-                    ],
-                    "subjectId": self._subject_id,
-                }
-            ]
-        }
-        
-        response = await self._request("POST", API_RESOURCE_QUERY, data=payload)
+    async def get_device_status(
+        self,
+        attrs: Iterable[str] = STATUS_ATTRS + SETTINGS_ATTRS,
+        skip_unchanged: bool = False,
+        priority: int = PRIORITY_BACKGROUND,
+    ) -> dict[str, Any] | None:
+        """Get device status for the given resource attrs.
+
+        With skip_unchanged, returns None if the response is byte-identical
+        to the last one for the same attrs.
+        """
+        attrs = tuple(attrs)
+        payload = self._encoded_body(
+            (API_RESOURCE_QUERY, attrs),
+            lambda: {
+                "data": [
+                    {
+                        "options": list(attrs),
+                        "subjectId": self._subject_id,
+                    }
+                ]
+            },
+        )
+
+        response = await self._request(
+            "POST",
+            API_RESOURCE_QUERY,
+            data=payload,
+            priority=priority,
+            merge=True,
+            skip_unchanged=skip_unchanged,
+        )
         return response
 
     async def set_video(self, enabled: bool) -> dict[str, Any]:
         """Enable or disable video."""
+        return await self.write_resources({"set_video": 1 if enabled else 0})
+
+    async def write_resources(
+        self, attrs: dict[str, Any], priority: int = PRIORITY_INTERACTIVE
+    ) -> dict[str, Any]:
+        """Write resource attrs."""
         if not self._subject_id:
-            raise ValueError("subject_id is required to set video state")
+            raise ValueError("subject_id is required to write resources")
 
         payload = {
-            "data": {"set_video": 1 if enabled else 0},
+            "data": attrs,
             "subjectId": self._subject_id,
         }
 
-        response = await self._request("POST", API_RESOURCE_WRITE, data=payload)
+        response = await self._request(
+            "POST", API_RESOURCE_WRITE, data=payload, priority=priority
+        )
         return response
 
-    async def get_face_info(self) -> dict[str, Any]:
+    async def get_face_info(
+        self, priority: int = PRIORITY_BACKGROUND
+    ) -> dict[str, Any]:
         """Get face info list."""
         if not self._subject_id:
             raise ValueError("subject_id is required to get face info")
 
         endpoint = f"{API_FACE_INFO}?did={self._subject_id}"
-        response = await self._request("GET", endpoint)
+        response = await self._request("GET", endpoint, priority=priority, merge=True)
         return response
 
     async def get_last_face_event(self) -> dict[str, Any]:
         """Get the latest face detection event."""
+        return await self.get_face_history(size=1)
+
+    async def get_face_history(
+        self,
+        size: int = 100,
+        start_time: int = HISTORY_START_TIME,
+        scan_id: str = "",
+    ) -> dict[str, Any]:
+        """Get a page of face detection events (newest first)."""
+        return await self.get_event_history(
+            (FACE_EVENT_RESOURCE_ID,), size, start_time, scan_id
+        )
+
+    async def get_event_history(
+        self,
+        resource_ids: Iterable[str],
+        size: int = 100,
+        start_time: int = HISTORY_START_TIME,
+        scan_id: str = "",
+        skip_unchanged: bool = False,
+        priority: int = PRIORITY_BACKGROUND,
+    ) -> dict[str, Any] | None:
+        """Get a page of events of several resources in one call (newest first).
+
+        With skip_unchanged, returns None if the response is byte-identical
+        to the last one for the same query.
+        """
         if not self._subject_id:
             raise ValueError("subject_id is required to get history log")
 
-        payload = {
-            "resourceIds": ["13.95.85"],
-            "scanId": "",
-            "size": "1",
-            "startTime": 1514736000000,
-            "subjectId": self._subject_id,
-        }
-        response = await self._request("POST", API_HISTORY_LOG, data=payload)
+        resource_ids = tuple(resource_ids)
+
+        def build() -> dict[str, Any]:
+            return {
+                "resourceIds": list(resource_ids),
+                "scanId": scan_id,
+                "size": str(size),
+                "startTime": start_time,
+                "subjectId": self._subject_id,
+            }
+
+        # Paged backfill queries are one-off, only the poll query is cached
+        payload: dict[str, Any] | bytes = build()
+        if not scan_id and start_time == HISTORY_START_TIME:
+            payload = self._encoded_body(
+                (API_HISTORY_LOG, resource_ids, size), build
+            )
+        response = await self._request(
+            "POST",
+            API_HISTORY_LOG,
+            data=payload,
+            priority=priority,
+            merge=True,
+            skip_unchanged=skip_unchanged,
+        )
         return response
+
+    async def get_snapshot(
+        self, priority: int = PRIORITY_INTERACTIVE
+    ) -> bytes | None:
+        """Capture a snapshot in the cloud and download the image bytes."""
+        if not self._subject_id:
+            raise ValueError("subject_id is required to get a snapshot")
+
+        await self._request(
+            "POST",
+            API_CAMERA_OPERATE,
+            data={"subjectId": self._subject_id, "operate": "snapshot"},
+            priority=priority,
+        )
+        response = await self._request(
+            "POST",
+            API_VIEW_DATA_QUERY,
+            data={"subjectId": self._subject_id, "viewType": "snapshot"},
+            priority=priority,
+        )
+        url = self._extract_snapshot_url(response)
+        if not url:
+            _LOGGER.debug("No snapshot url in view data response: %s", response)
+            return None
+
+        try:
+            return await self._tracked(self._download(url))
+        except asyncio.CancelledError:
+            if self._closed_under_caller():
+                raise ConnectionError("Aqara API client is closed") from None
+            raise
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Snapshot download error: %s", err)
+            raise ConnectionError(f"Error downloading Aqara snapshot: {err}") from err
+
+    async def _download(self, url: str) -> bytes:
+        """Download a snapshot image."""
+        async with self._session.get(
+            url, timeout=aiohttp.ClientTimeout(total=10)
+        ) as image_response:
+            image_response.raise_for_status()
+            return await image_response.read()
+
+    @staticmethod
+    def _extract_snapshot_url(data: dict | None) -> str | None:
+        """Extract the image url from a view data response."""
+        if not isinstance(data, dict):
+            return None
+
+        result = data.get("result")
+        candidates: list = []
+        if isinstance(result, dict):
+            candidates.append(result)
+            for key in ("data", "list", "resultList"):
+                value = result.get(key)
+                if isinstance(value, list):
+                    candidates.extend(value)
+                elif isinstance(value, dict):
+                    candidates.append(value)
+        elif isinstance(result, list):
+            candidates.extend(result)
+        elif isinstance(result, str) and result.startswith("http"):
+            return result
+
+        for item in candidates:
+            if not isinstance(item, dict):
+                continue
+            url = (
+                item.get("url")
+                or item.get("imageUrl")
+                or item.get("picUrl")
+                or item.get("snapshotUrl")
+            )
+            if url:
+                return str(url)
+        return None
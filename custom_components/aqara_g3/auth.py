@@ -1,19 +1,30 @@
 """Account auth helper for Aqara Cloud."""
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import json
 import time
 import uuid
 import urllib.parse
-from typing import Any
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 
+from homeassistant.util.json import json_loads
+
 from .const import AQARA_AREA_MAP
+from .models import parse_device_list
+
+if TYPE_CHECKING:
+    from .latency import EndpointLatency, LatencyTracker
+    from .ratelimit import TokenBucket
+
+DEFAULT_TIMEOUT = 15.0
 
 _PUBLIC_KEY = """-----BEGIN PUBLIC KEY-----
 MIGfMA0GCSqGSIb3DQEBAQUAA4GNADCBiQKBgQCG46slB57013JJs4Vvj5cVyMpR
@@ -23,23 +34,115 @@ rZzBHsMuBwA4LQdxBwIDAQAB
 -----END PUBLIC KEY-----"""
 
 
+def sign_headers(headers: dict[str, str]) -> str:
+    """Sign Aqara headers (Appid, Nonce, Time, Token, RequestBody, Appkey)."""
+    if headers.get("Token"):
+        sign_source = (
+            "Appid={Appid}&Nonce={Nonce}&Time={Time}&Token={Token}&"
+            "{RequestBody}&{Appkey}"
+        ).format(**headers)
+    else:
+        sign_source = (
+            "Appid={Appid}&Nonce={Nonce}&Time={Time}&{RequestBody}&{Appkey}"
+        ).format(**headers)
+    return hashlib.md5(sign_source.encode()).hexdigest()
+
+
+def area_for_url(
+    aqara_url: str, area_map: Mapping[str, Mapping[str, str]] = AQARA_AREA_MAP
+) -> str:
+    """Return the first area whose server matches an entry's aqara_url."""
+    for area, area_cfg in area_map.items():
+        server = area_cfg["server"].replace("https://", "").replace("http://", "")
+        if server.strip("/") == aqara_url:
+            return area
+    return "OTHER"
+
+
+def probe_areas(
+    area_map: Mapping[str, Mapping[str, str]] = AQARA_AREA_MAP,
+) -> list[str]:
+    """Return one area per distinct server, in map order."""
+    areas: dict[str, str] = {}
+    for area, area_cfg in area_map.items():
+        areas.setdefault(area_cfg["server"], area)
+    return list(areas.values())
+
+
+async def async_probe_login(
+    clients: Iterable[AqaraAccountClient], username: str, password: str
+) -> tuple[AqaraAccountClient, dict[str, str]]:
+    """Log in on every client at once and return the first that succeeds.
+
+    The remaining logins are cancelled. Raises PermissionError if every
+    server refused the credentials, ConnectionError otherwise.
+    """
+    tasks = {
+        asyncio.ensure_future(client.async_login(username, password)): client
+        for client in clients
+    }
+    errors: list[BaseException] = []
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            # Retrieve every error in the batch so none is logged as unhandled
+            winner = None
+            for task in done:
+                if task.exception() is None:
+                    winner = winner or task
+                else:
+                    errors.append(task.exception())
+            if winner is not None:
+                return tasks[winner], winner.result()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+    if errors and all(isinstance(err, PermissionError) for err in errors):
+        raise PermissionError("Login refused by every Aqara region")
+    raise ConnectionError(
+        f"Cannot log in to any Aqara region: {errors[0] if errors else 'no regions'}"
+    )
+
+
 class AqaraAccountClient:
     """Client to authenticate with Aqara account and fetch devices."""
 
-    def __init__(self, session: aiohttp.ClientSession, area: str) -> None:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        area: str,
+        limiter: TokenBucket | None = None,
+        latency: LatencyTracker | None = None,
+        area_map: Mapping[str, Mapping[str, str]] = AQARA_AREA_MAP,
+        token: str | None = None,
+        userid: str | None = None,
+    ) -> None:
         """Initialize client."""
         area_key = (area or "").upper()
-        if area_key not in AQARA_AREA_MAP:
+        if area_key not in area_map:
             area_key = "OTHER"
-        area_cfg = AQARA_AREA_MAP[area_key]
+        area_cfg = area_map[area_key]
 
         self._session = session
+        self.limiter = limiter
+        self.latency = latency
         self._area = area_key
         self._server = area_cfg["server"]
         self._appid = area_cfg["appid"]
         self._appkey = area_cfg["appkey"]
-        self._token: str | None = None
-        self._userid: str | None = None
+        # A token of an existing entry skips the login
+        self._token = token
+        self._userid = userid
+
+    @property
+    def area(self) -> str:
+        """Return the area key."""
+        return self._area
 
     @property
     def appid(self) -> str:
@@ -65,13 +168,20 @@ class AqaraAccountClient:
         headers.setdefault("Content-Type", "application/json")
         url = f"{self._server}/app/v1.0/lumi/user/login"
 
+        if self.limiter:
+            await self.limiter.acquire()
+
+        stats = self._latency_for("/lumi/user/login")
+        start = time.monotonic()
         try:
             async with self._session.request(
                 "POST",
                 url,
                 data=payload_str,
                 headers=headers,
-                timeout=aiohttp.ClientTimeout(total=15),
+                timeout=aiohttp.ClientTimeout(
+                    total=stats.timeout if stats else DEFAULT_TIMEOUT
+                ),
             ) as response:
                 response_text = await response.text()
 
@@ -99,7 +209,7 @@ class AqaraAccountClient:
                         raise ConnectionError(f"HTTP {response.status} error: {response_text}")
 
                 response.raise_for_status()
-                data = await response.json()
+                data = json_loads(response_text)
 
                 if not isinstance(data, dict):
                     raise PermissionError(f"Invalid response format: {response_text}")
@@ -117,6 +227,8 @@ class AqaraAccountClient:
 
                 self._token = str(token)
                 self._userid = str(userid)
+                if stats:
+                    stats.async_record(time.monotonic() - start)
 
                 return {
                     "token": self._token,
@@ -140,6 +252,12 @@ class AqaraAccountClient:
         response = await self._request(
             "GET", "/lumi/app/position/device/query", params={}
         )
+        code = response.get("code") if isinstance(response, dict) else None
+        if code not in (None, 0):
+            # Expired or revoked tokens are answered with an error code
+            raise PermissionError(
+                f"Device query rejected: {response.get('message')} (code: {code})"
+            )
         return self._extract_device_list(response)
 
     def _encrypt_password(self, password: str) -> str:
@@ -174,18 +292,15 @@ class AqaraAccountClient:
         headers["Sign"] = sign
         return headers
 
+    def _latency_for(self, endpoint: str) -> EndpointLatency | None:
+        """Return the latency window of an endpoint, if tracking is enabled."""
+        if self.latency is None:
+            return None
+        return self.latency.get(endpoint, DEFAULT_TIMEOUT)
+
     def _sign_header(self, headers: dict[str, str]) -> str:
         """Sign header using Aqara algorithm."""
-        if headers.get("Token"):
-            sign_source = (
-                "Appid={Appid}&Nonce={Nonce}&Time={Time}&Token={Token}&"
-                "{RequestBody}&{Appkey}"
-            ).format(**headers)
-        else:
-            sign_source = (
-                "Appid={Appid}&Nonce={Nonce}&Time={Time}&{RequestBody}&{Appkey}"
-            ).format(**headers)
-        return hashlib.md5(sign_source.encode()).hexdigest()
+        return sign_headers(headers)
 
     async def _request(
         self,
@@ -205,6 +320,11 @@ class AqaraAccountClient:
             headers.setdefault("Content-Type", "application/json")
         url = f"{self._server}/app/v1.0{endpoint}"
 
+        if self.limiter:
+            await self.limiter.acquire()
+
+        stats = self._latency_for(endpoint)
+        start = time.monotonic()
         try:
             async with self._session.request(
                 method,
@@ -212,32 +332,25 @@ class AqaraAccountClient:
                 params=params if method.upper() == "GET" else None,
                 data=None if method.upper() == "GET" else payload_str,
                 headers=headers,
-                timeout=aiohttp.ClientTimeout(total=15),
+                timeout=aiohttp.ClientTimeout(
+                    total=stats.timeout if stats else DEFAULT_TIMEOUT
+                ),
             ) as response:
                 if response.status in (401, 403):
                     raise PermissionError("Invalid authentication credentials")
                 response.raise_for_status()
-                return await response.json()
+                result = json_loads(await response.read())
+            if stats:
+                stats.async_record(time.monotonic() - start)
+            return result
+        except asyncio.TimeoutError as err:
+            if stats:
+                stats.async_record(time.monotonic() - start)
+            raise ConnectionError(f"Timeout communicating with Aqara API: {err}") from err
         except aiohttp.ClientConnectorError as err:
             raise ConnectionError(f"Cannot connect to Aqara API: {err}") from err
         except aiohttp.ClientError as err:
             raise ConnectionError(f"Error communicating with Aqara API: {err}") from err
 
-    @staticmethod
-    def _extract_device_list(data: dict | None) -> list[dict[str, Any]]:
-        """Extract device list from response."""
-        if not isinstance(data, dict):
-            return []
-        result = data.get("result")
-        if isinstance(result, dict):
-            for key in ("data", "list", "deviceList", "devices"):
-                value = result.get(key)
-                if isinstance(value, list):
-                    return value
-        if isinstance(result, list):
-            return result
-        for key in ("data", "list", "deviceList", "devices"):
-            value = data.get(key)
-            if isinstance(value, list):
-                return value
-        return []
+    # Kept under its historic name; the parser lives in models.py
+    _extract_device_list = staticmethod(parse_device_list)
@@ -1,17 +1,23 @@
 """Binary sensor platform for Aqara Camera G3."""
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 import logging
+from typing import Any
 
-from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util, slugify
 
-from .const import DOMAIN
+from .const import DOMAIN, LANE_EVENT, LANE_SETTINGS
 from .coordinator import AqaraG3DataUpdateCoordinator
+from .entity import AqaraG3Entity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,6 +28,18 @@ SENSORS = {
     "human_detect": ("human_detect_enable", "Human Detect", "mdi:account"),
 }
 
+# Event type -> (name, device class) of the detection sensors
+DETECTIONS = {
+    "motion": ("Motion", BinarySensorDeviceClass.MOTION),
+    "human": ("Human", BinarySensorDeviceClass.OCCUPANCY),
+    "pet": ("Pet", BinarySensorDeviceClass.MOTION),
+    "sound": ("Sound", BinarySensorDeviceClass.SOUND),
+    "gesture": ("Gesture", BinarySensorDeviceClass.MOTION),
+}
+
+# How long a detection sensor stays on after the event
+DETECTION_HOLD = timedelta(seconds=60)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -43,10 +61,19 @@ async def async_setup_entry(
         AqaraG3BinarySensor(coordinator, key, api_key, name, icon)
         for key, (api_key, name, icon) in SENSORS.items()
     ]
+    entities.extend(
+        AqaraG3DetectionSensor(coordinator, event_type, *DETECTIONS[event_type])
+        for event_type in coordinator.event_resources
+        if event_type in DETECTIONS
+    )
+    entities.extend(
+        AqaraG3PresenceSensor(coordinator, person)
+        for person in sorted(coordinator.mapped_persons)
+    )
     async_add_entities(entities, update_before_add=True)
 
 
-class AqaraG3BinarySensor(CoordinatorEntity, BinarySensorEntity):
+class AqaraG3BinarySensor(AqaraG3Entity, BinarySensorEntity):
     """Representation of an Aqara Camera G3 binary sensor."""
 
     def __init__(
@@ -58,47 +85,133 @@ class AqaraG3BinarySensor(CoordinatorEntity, BinarySensorEntity):
         icon: str,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._sensor_key = sensor_key
-        self._api_key = api_key
+        super().__init__(coordinator, sensor_key, api_key, bool, LANE_SETTINGS)
         self._attr_name = f"Aqara G3 {sensor_name}"
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{sensor_key}"
         self._attr_icon = icon
-        self._logged_no_data = False
 
     @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name="Aqara Camera G3",
-            manufacturer="Aqara",
-            model="Camera G3",
-            configuration_url="https://home.aqara.com",
+    def is_on(self) -> bool | None:
+        """Return True if the sensor is on."""
+        return self._get_value()
+
+
+class AqaraG3DetectionSensor(AqaraG3Entity, BinarySensorEntity):
+    """On for a short hold time after the camera logs an event of one type."""
+
+    _attr_is_on = False
+    _unrecorded_attributes = frozenset({"last_detected"})
+
+    def __init__(
+        self,
+        coordinator: AqaraG3DataUpdateCoordinator,
+        event_type: str,
+        sensor_name: str,
+        device_class: BinarySensorDeviceClass,
+    ) -> None:
+        """Initialize the detection sensor."""
+        super().__init__(
+            coordinator, f"{event_type}_detected", f"last_{event_type}_ts", int, LANE_EVENT
         )
+        self._attr_name = f"Aqara G3 {sensor_name}"
+        self._attr_device_class = device_class
+        self._last_detected: datetime | None = None
+        self._unsub_hold: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Evaluate the cached detection once added."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_hold)
+        self._async_update_detection()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the event lane."""
+        self._async_update_detection()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_update_detection(self) -> None:
+        """Turn on until the hold of the latest event expires."""
+        self._async_cancel_hold()
+        ts = self._get_value()
+        if ts is None:
+            self._attr_is_on = False
+            return
+        self._last_detected = dt_util.utc_from_timestamp(ts / 1000)
+        off_at = self._last_detected + DETECTION_HOLD
+        self._attr_is_on = off_at > dt_util.utcnow()
+        if self._attr_is_on:
+            self._unsub_hold = async_track_point_in_utc_time(
+                self.hass, self._async_hold_expired, off_at
+            )
+
+    @callback
+    def _async_hold_expired(self, _now: datetime) -> None:
+        """Turn off once the hold time has passed."""
+        self._unsub_hold = None
+        self._attr_is_on = False
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_hold(self) -> None:
+        """Cancel a pending turn-off."""
+        if self._unsub_hold:
+            self._unsub_hold()
+            self._unsub_hold = None
 
     @property
-    def is_on(self) -> bool | None:
-        """Return True if the sensor is on."""
-        data = self.coordinator.data
-        if not isinstance(data, dict):
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return when the event was last detected."""
+        if self._last_detected is None:
             return None
+        return {"last_detected": self._last_detected.isoformat()}
 
-        value = data.get(self._api_key)
-        if value is None:
-            if not self._logged_no_data:
-                _LOGGER.debug(
-                    "Missing api key '%s' for %s. Available keys: %s",
-                    self._api_key,
-                    self._sensor_key,
-                    list(data.keys()),
-                )
-                self._logged_no_data = True
-            return None
-        self._logged_no_data = False
 
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value.lower() in ("1", "true", "yes", "on")
-        return bool(value)
+class AqaraG3PresenceSensor(AqaraG3Entity, BinarySensorEntity):
+    """On while this camera is the last to have seen a mapped person.
+
+    Expiry is driven by the shared presence engine, so the sensor itself
+    keeps no timer.
+    """
+
+    _attr_device_class = BinarySensorDeviceClass.OCCUPANCY
+    _attr_icon = "mdi:account-eye"
+    _unrecorded_attributes = frozenset({"last_seen", "seen_by"})
+
+    def __init__(
+        self,
+        coordinator: AqaraG3DataUpdateCoordinator,
+        person_entity_id: str,
+    ) -> None:
+        """Initialize the presence sensor."""
+        super().__init__(
+            coordinator, f"presence_{slugify(person_entity_id)}", None, None, LANE_EVENT
+        )
+        self._person = person_entity_id
+        state = coordinator.hass.states.get(person_entity_id)
+        person_name = state.name if state and state.name else person_entity_id
+        self._attr_name = f"Aqara G3 {person_name} presence"
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the person's sightings once added."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.hub.presence.async_subscribe(self._person, self.async_write_ha_state)
+        )
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if this camera saw the person within the hold time."""
+        sighting = self.hub.presence.sighting(self._person)
+        return sighting is not None and sighting.camera == self.hub.config_entry.entry_id
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the person and where they were last seen."""
+        attrs: dict[str, Any] = {"person": self._person}
+        sighting = self.hub.presence.sighting(self._person)
+        if sighting is not None:
+            attrs["last_seen"] = dt_util.utc_from_timestamp(sighting.ts / 1000).isoformat()
+            entry = self.hass.config_entries.async_get_entry(sighting.camera)
+            attrs["seen_by"] = entry.title if entry else sighting.camera
+        return attrs
@@ -6,12 +6,11 @@ import logging
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, LANE_EVENT
 from .coordinator import AqaraG3DataUpdateCoordinator
+from .entity import AqaraG3Entity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,7 +34,7 @@ async def async_setup_entry(
     async_add_entities([AqaraG3RefreshFaceListButton(coordinator)], update_before_add=True)
 
 
-class AqaraG3RefreshFaceListButton(CoordinatorEntity, ButtonEntity):
+class AqaraG3RefreshFaceListButton(AqaraG3Entity, ButtonEntity):
     """Button to refresh face list."""
 
     _attr_name = "Aqara G3 Refresh Face List"
@@ -43,24 +42,12 @@ class AqaraG3RefreshFaceListButton(CoordinatorEntity, ButtonEntity):
 
     def __init__(self, coordinator: AqaraG3DataUpdateCoordinator) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_refresh_face_list"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name="Aqara Camera G3",
-            manufacturer="Aqara",
-            model="Camera G3",
-            configuration_url="https://home.aqara.com",
-        )
+        super().__init__(coordinator, "refresh_face_list", lane=LANE_EVENT)
 
     async def async_press(self) -> None:
         """Handle the button press."""
         try:
-            await self.coordinator.async_get_face_map(force_refresh=True)
+            await self.hub.async_get_face_map(force_refresh=True)
             await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.warning("Failed to refresh face list: %s", err)
@@ -0,0 +1,129 @@
+"""Camera platform for Aqara Camera G3."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import timedelta
+
+from homeassistant.components.camera import Camera
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, LANE_EVENT
+from .coordinator import AqaraG3DataUpdateCoordinator
+from .entity import AqaraG3Entity
+from .request_queue import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_CACHE_TTL = timedelta(seconds=30)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Aqara Camera G3 camera platform."""
+    data = hass.data[DOMAIN].get(entry.entry_id)
+    if not data or not isinstance(data, dict):
+        _LOGGER.error("Integration data not found or invalid for entry %s", entry.entry_id)
+        return
+
+    coordinator = data.get("coordinator")
+    if not coordinator or not isinstance(coordinator, AqaraG3DataUpdateCoordinator):
+        _LOGGER.error("Coordinator not found or invalid for entry %s", entry.entry_id)
+        return
+
+    async_add_entities([AqaraG3Camera(coordinator)])
+
+
+class SnapshotCache:
+    """In-memory snapshot cache that coalesces concurrent fetches."""
+
+    def __init__(self, coordinator: AqaraG3DataUpdateCoordinator, ttl: timedelta) -> None:
+        """Initialize the cache."""
+        self._coordinator = coordinator
+        self._ttl = ttl.total_seconds()
+        self._image: bytes | None = None
+        self._fetched_at: float | None = None
+        self._inflight: asyncio.Task[bytes | None] | None = None
+
+    @property
+    def is_fresh(self) -> bool:
+        """Return True if the cached image is within its TTL."""
+        return (
+            self._image is not None
+            and self._fetched_at is not None
+            and time.monotonic() - self._fetched_at < self._ttl
+        )
+
+    async def async_get(self, force_refresh: bool = False) -> bytes | None:
+        """Return the cached image, fetching at most once for all callers."""
+        if not force_refresh and self.is_fresh:
+            return self._image
+
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(
+                self._async_fetch(PRIORITY_INTERACTIVE)
+            )
+        # Shield so one cancelled viewer does not abort the shared fetch
+        return await asyncio.shield(self._inflight)
+
+    @callback
+    def async_prefetch(self) -> None:
+        """Start a background fetch unless one is already running."""
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(
+                self._async_fetch(PRIORITY_BACKGROUND)
+            )
+
+    async def _async_fetch(self, priority: int) -> bytes | None:
+        """Fetch a new snapshot, keeping the previous image on failure."""
+        try:
+            image = await self._coordinator.api.get_snapshot(priority)
+            if image:
+                self._image = image
+                self._fetched_at = time.monotonic()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Failed to fetch snapshot: %s", err)
+        finally:
+            self._inflight = None
+        return self._image
+
+
+class AqaraG3Camera(AqaraG3Entity, Camera):
+    """Camera entity serving cached cloud snapshots."""
+
+    _attr_name = "Aqara G3 Camera"
+
+    def __init__(self, coordinator: AqaraG3DataUpdateCoordinator) -> None:
+        """Initialize the camera."""
+        AqaraG3Entity.__init__(
+            self, coordinator, "camera", "last_face_ts", lane=LANE_EVENT
+        )
+        Camera.__init__(self)
+        self._cache = SnapshotCache(coordinator, SNAPSHOT_CACHE_TTL)
+        self._last_face_ts = self._current_face_ts()
+
+    def _current_face_ts(self) -> object:
+        """Return the last face timestamp from the event lane."""
+        data = self.coordinator.data
+        return data.get(self._api_key) if data is not None else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Prefetch a snapshot when a new face event arrives."""
+        face_ts = self._current_face_ts()
+        if face_ts is not None and face_ts != self._last_face_ts:
+            self._cache.async_prefetch()
+        self._last_face_ts = face_ts
+        super()._handle_coordinator_update()
+
+    async def async_camera_image(
+        self, width: int | None = None, height: int | None = None
+    ) -> bytes | None:
+        """Return the latest snapshot from the shared cache."""
+        return await self._cache.async_get()
@@ -1,12 +1,14 @@
 """Config flow for Aqara Camera G3 integration."""
 from __future__ import annotations
 
+import difflib
 import logging
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.components import webhook
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
@@ -14,24 +16,64 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .auth import AqaraAccountClient
+from .auth import (
+    AqaraAccountClient,
+    area_for_url,
+    async_probe_login,
+    probe_areas,
+)
+from .latency import async_get_latency_tracker
+from .models import AqaraDevice, parse_event_resources
+from .ratelimit import async_get_rate_limiter
 from .const import (
     AQARA_AREA_MAP,
+    AREA_AUTO,
     CONF_AQARA_URL,
     CONF_APPID,
     CONF_AREA,
+    CONF_EVENT_INTERVAL,
+    CONF_EVENT_RESOURCES,
+    CONF_FACE_ACTION,
+    CONF_FACE_EXPIRY,
     CONF_FACE_NAME_MAP,
+    CONF_JOURNAL_RETENTION,
+    CONF_PRESENCE_HOLD,
     CONF_PASSWORD,
+    CONF_PUSH_MODE,
+    CONF_RATE_LIMIT,
+    CONF_RSSI_DEADBAND,
+    CONF_RSSI_REPORT_INTERVAL,
+    CONF_RSSI_WINDOW,
+    CONF_SEARCH,
     CONF_SUBJECT_ID,
+    CONF_SUGGEST,
     CONF_TOKEN,
     CONF_USERID,
     CONF_USERNAME,
+    CONF_WEBHOOK_ID,
+    DEFAULT_EVENT_INTERVAL,
+    DEFAULT_EVENT_RESOURCES,
+    DEFAULT_FACE_EXPIRY,
+    DEFAULT_JOURNAL_RETENTION,
+    DEFAULT_PRESENCE_HOLD,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RSSI_DEADBAND,
+    DEFAULT_RSSI_REPORT_INTERVAL,
+    DEFAULT_RSSI_WINDOW,
     DOMAIN,
+    FACE_ACTION_NEXT,
+    FACE_ACTION_PREVIOUS,
+    FACE_ACTION_SAVE,
+    FACE_ACTION_SEARCH,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-AREA_OPTIONS = [
+FACES_PAGE_SIZE = 20
+# Minimum difflib ratio for suggesting a person from a face name
+FACE_SUGGEST_CUTOFF = 0.6
+
+AREA_OPTIONS = [{"value": AREA_AUTO, "label": "Auto"}] + [
     {"value": key, "label": key} for key in AQARA_AREA_MAP.keys()
 ]
 
@@ -39,7 +81,7 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_USERNAME): str,
         vol.Required(CONF_PASSWORD): str,
-        vol.Required(CONF_AREA, default="CN"): selector.SelectSelector(
+        vol.Required(CONF_AREA, default=AREA_AUTO): selector.SelectSelector(
             selector.SelectSelectorConfig(
                 options=AREA_OPTIONS,
                 multiple=False,
@@ -50,15 +92,34 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+def _make_client(
+    hass: HomeAssistant, area: str, **kwargs: Any
+) -> AqaraAccountClient:
+    """Build an account client sharing the region's limiter and latency."""
+    client = AqaraAccountClient(
+        session=async_get_clientsession(hass), area=area, **kwargs
+    )
+    client.limiter = async_get_rate_limiter(hass, client.aqara_url)
+    client.latency = async_get_latency_tracker(hass, client.aqara_url)
+    return client
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
-    session = async_get_clientsession(hass)
-    client = AqaraAccountClient(session=session, area=data[CONF_AREA])
-
     try:
-        credentials = await client.async_login(
-            data[CONF_USERNAME], data[CONF_PASSWORD]
-        )
+        if data[CONF_AREA] == AREA_AUTO:
+            client, credentials = await async_probe_login(
+                (_make_client(hass, area) for area in probe_areas()),
+                data[CONF_USERNAME],
+                data[CONF_PASSWORD],
+            )
+            _LOGGER.debug("Aqara account found in area %s", client.area)
+        else:
+            client = _make_client(hass, data[CONF_AREA])
+            credentials = await client.async_login(
+                data[CONF_USERNAME], data[CONF_PASSWORD]
+            )
+        credentials[CONF_AREA] = client.area
         devices = await client.async_get_devices()
     except PermissionError as err:
         _LOGGER.error("Invalid authentication: %s", err)
@@ -73,6 +134,31 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     return {"credentials": credentials, "devices": devices}
 
 
+async def validate_token(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Fetch the device list with the token of an existing entry."""
+    area = entry.data.get(CONF_AREA) or area_for_url(entry.data[CONF_AQARA_URL])
+    client = _make_client(
+        hass, area, token=entry.data[CONF_TOKEN], userid=entry.data[CONF_USERID]
+    )
+    try:
+        devices = await client.async_get_devices()
+    except PermissionError as err:
+        _LOGGER.debug("Token of %s was rejected: %s", entry.title, err)
+        raise InvalidAuth from err
+    except ConnectionError as err:
+        _LOGGER.error("Cannot connect to Aqara API: %s", err)
+        raise CannotConnect from err
+
+    credentials = {
+        CONF_AQARA_URL: entry.data[CONF_AQARA_URL],
+        CONF_TOKEN: entry.data[CONF_TOKEN],
+        CONF_APPID: entry.data[CONF_APPID],
+        CONF_USERID: entry.data[CONF_USERID],
+        CONF_AREA: area,
+    }
+    return {"credentials": credentials, "devices": devices}
+
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Aqara Camera G3."""
 
@@ -83,10 +169,83 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step."""
+        """Offer to reuse a configured account before signing in."""
+        if self._accounts():
+            return self.async_show_menu(
+                step_id="user", menu_options=["reuse", "login"]
+            )
+        return await self.async_step_login(user_input)
+
+    def _accounts(self) -> dict[str, ConfigEntry]:
+        """Return one configured entry per Aqara account (userid)."""
+        accounts: dict[str, ConfigEntry] = {}
+        for entry in self._async_current_entries(include_ignore=False):
+            userid = entry.data.get(CONF_USERID)
+            if userid and entry.data.get(CONF_TOKEN):
+                accounts.setdefault(userid, entry)
+        return accounts
+
+    async def async_step_reuse(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Query devices with the token of an already configured account."""
+        accounts = self._accounts()
+        if not accounts:
+            return await self.async_step_login()
+        if user_input is None and len(accounts) > 1:
+            return self._show_reuse_form(accounts, {})
+
+        userid = user_input[CONF_USERID] if user_input else next(iter(accounts))
+        errors: dict[str, str] = {}
+        try:
+            info = await validate_token(self.hass, accounts[userid])
+        except InvalidAuth:
+            # Only sign in again when the saved token no longer works
+            return self.async_show_form(
+                step_id="login",
+                data_schema=STEP_USER_DATA_SCHEMA,
+                errors={"base": "token_rejected"},
+            )
+        except CannotConnect:
+            errors["base"] = "cannot_connect"
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected exception")
+            errors["base"] = "unknown"
+        else:
+            self._login_data = info["credentials"]
+            self._devices = info["devices"]
+            return await self.async_step_device()
+
+        return self._show_reuse_form(accounts, errors)
+
+    def _show_reuse_form(
+        self, accounts: dict[str, ConfigEntry], errors: dict[str, str]
+    ) -> FlowResult:
+        """Show the account selection form."""
+        options = [
+            {"value": userid, "label": f"{entry.title} ({userid})"}
+            for userid, entry in accounts.items()
+        ]
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_USERID): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=options,
+                        multiple=False,
+                        mode=selector.SelectSelectorMode.DROPDOWN,
+                    )
+                )
+            }
+        )
+        return self.async_show_form(step_id="reuse", data_schema=schema, errors=errors)
+
+    async def async_step_login(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Sign in to the Aqara account."""
         if user_input is None:
             return self.async_show_form(
-                step_id="user", data_schema=STEP_USER_DATA_SCHEMA
+                step_id="login", data_schema=STEP_USER_DATA_SCHEMA
             )
 
         errors = {}
@@ -106,7 +265,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_device()
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="login", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
     async def async_step_device(
@@ -114,7 +273,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle device selection step."""
         if not self._login_data:
-            return await self.async_step_user()
+            return await self.async_step_login()
 
         errors: dict[str, str] = {}
         if user_input is not None:
@@ -124,6 +283,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_TOKEN: self._login_data[CONF_TOKEN],
                 CONF_APPID: self._login_data[CONF_APPID],
                 CONF_USERID: self._login_data[CONF_USERID],
+                CONF_AREA: self._login_data[CONF_AREA],
                 CONF_SUBJECT_ID: subject_id,
             }
             await self.async_set_unique_id(subject_id)
@@ -140,28 +300,16 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def _build_device_schema(self, errors: dict[str, str]) -> vol.Schema:
         """Build device selection schema from fetched list."""
-        devices = self._devices or []
         options: list[dict[str, str]] = []
-        for item in devices:
-            if not isinstance(item, dict):
-                continue
-            device_id = (
-                item.get("subjectId")
-                or item.get("deviceId")
-                or item.get("did")
-                or item.get("devId")
-                or item.get("id")
-            )
-            if not device_id:
+        configured = self._async_current_ids()
+        for item in self._devices or []:
+            device = AqaraDevice.from_item(item)
+            if device is None or device.device_id in configured:
                 continue
-            name = (
-                item.get("name")
-                or item.get("deviceName")
-                or item.get("positionName")
-                or item.get("model")
+            label = (
+                f"{device.name} ({device.device_id})" if device.name else device.device_id
             )
-            label = f"{name} ({device_id})" if name else str(device_id)
-            options.append({"value": str(device_id), "label": label})
+            options.append({"value": device.device_id, "label": label})
 
         if not options:
             errors["base"] = "no_devices"
@@ -200,6 +348,13 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry: ConfigEntry) -> None:
         """Initialize options flow."""
         self._config_entry = config_entry
+        self._face_names: list[str] | None = None
+        self._filtered: list[str] = []
+        self._persons_by_name: dict[str, str] = {}
+        self._person_selector: selector.SelectSelector | None = None
+        self._face_changes: dict[str, str] = {}
+        self._suggest = True
+        self._page = 0
 
     async def _get_face_list(self) -> dict[str, str]:
         """Fetch current face list from coordinator."""
@@ -214,41 +369,234 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle options step for mapping faces to persons."""
+        """Show the options menu."""
+        return self.async_show_menu(step_id="init", menu_options=["faces", "settings"])
+
+    async def async_step_settings(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle integration settings."""
+        options = self._config_entry.options
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            try:
+                parse_event_resources(user_input.get(CONF_EVENT_RESOURCES, ""))
+            except ValueError:
+                errors[CONF_EVENT_RESOURCES] = "invalid_event_resources"
+            else:
+                return self.async_create_entry(
+                    title="", data={**options, **user_input}
+                )
+            # Keep what was typed when showing the error
+            options = {**options, **user_input}
+
+        webhook_id = self._config_entry.data.get(CONF_WEBHOOK_ID)
+        webhook_url = (
+            webhook.async_generate_url(self.hass, webhook_id)
+            if webhook_id
+            else "-"
+        )
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_PUSH_MODE, default=options.get(CONF_PUSH_MODE, False)
+                ): bool,
+                vol.Optional(
+                    CONF_FACE_EXPIRY,
+                    default=options.get(CONF_FACE_EXPIRY, DEFAULT_FACE_EXPIRY),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
+                vol.Optional(
+                    CONF_RATE_LIMIT,
+                    default=options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=50)),
+                vol.Optional(
+                    CONF_RSSI_DEADBAND,
+                    default=options.get(CONF_RSSI_DEADBAND, DEFAULT_RSSI_DEADBAND),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=20)),
+                vol.Optional(
+                    CONF_RSSI_WINDOW,
+                    default=options.get(CONF_RSSI_WINDOW, DEFAULT_RSSI_WINDOW),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+                vol.Optional(
+                    CONF_RSSI_REPORT_INTERVAL,
+                    default=options.get(
+                        CONF_RSSI_REPORT_INTERVAL, DEFAULT_RSSI_REPORT_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1440)),
+                vol.Optional(
+                    CONF_JOURNAL_RETENTION,
+                    default=options.get(
+                        CONF_JOURNAL_RETENTION, DEFAULT_JOURNAL_RETENTION
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3650)),
+                vol.Optional(
+                    CONF_PRESENCE_HOLD,
+                    default=options.get(CONF_PRESENCE_HOLD, DEFAULT_PRESENCE_HOLD),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
+                vol.Optional(
+                    CONF_EVENT_INTERVAL,
+                    default=options.get(CONF_EVENT_INTERVAL, DEFAULT_EVENT_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=2, max=600)),
+                vol.Optional(
+                    CONF_EVENT_RESOURCES,
+                    default=options.get(CONF_EVENT_RESOURCES, DEFAULT_EVENT_RESOURCES),
+                ): str,
+            }
+        )
+        return self.async_show_form(
+            step_id="settings",
+            data_schema=schema,
+            errors=errors,
+            description_placeholders={"webhook_url": webhook_url},
+        )
+
+    async def async_step_faces(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Search the face list before mapping faces to persons."""
+        if self._face_names is None:
+            await self._async_load_faces()
+
+        if user_input is not None:
+            query = user_input.get(CONF_SEARCH, "").strip().casefold()
+            self._suggest = user_input.get(CONF_SUGGEST, True)
+            self._filtered = [
+                name for name in self._face_names if query in name.casefold()
+            ]
+            self._page = 0
+            return await self.async_step_faces_page()
+
+        schema = vol.Schema(
+            {
+                vol.Optional(CONF_SEARCH, default=""): str,
+                vol.Optional(CONF_SUGGEST, default=self._suggest): bool,
+            }
+        )
+        return self.async_show_form(
+            step_id="faces",
+            data_schema=schema,
+            description_placeholders={
+                "total": str(len(self._face_names)),
+                "changes": str(len(self._face_changes)),
+            },
+        )
+
+    async def async_step_faces_page(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Map one page of faces to persons."""
         if user_input is not None:
-            face_name_map = {k: v for k, v in user_input.items() if v}
-            return self.async_create_entry(
-                title="", data={CONF_FACE_NAME_MAP: face_name_map}
+            action = user_input.pop(CONF_FACE_ACTION, FACE_ACTION_SAVE)
+            self._record_face_changes(user_input)
+            if action == FACE_ACTION_SEARCH:
+                return await self.async_step_faces()
+            if action == FACE_ACTION_SAVE:
+                return self._async_save_faces()
+            self._page += 1 if action == FACE_ACTION_NEXT else -1
+
+        pages = max(1, -(-len(self._filtered) // FACES_PAGE_SIZE))
+        self._page = min(max(self._page, 0), pages - 1)
+        schema_dict: dict[vol.Optional, object] = {}
+        for face_name in self._page_faces():
+            schema_dict[
+                vol.Optional(face_name, default=self._face_default(face_name))
+            ] = self._person_selector
+        has_next = self._page < pages - 1
+        actions = [FACE_ACTION_SAVE, FACE_ACTION_SEARCH]
+        if has_next:
+            actions.insert(0, FACE_ACTION_NEXT)
+        if self._page > 0:
+            actions.insert(0, FACE_ACTION_PREVIOUS)
+        default_action = FACE_ACTION_NEXT if has_next else FACE_ACTION_SAVE
+        schema_dict[
+            vol.Optional(CONF_FACE_ACTION, default=default_action)
+        ] = selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=actions,
+                translation_key=CONF_FACE_ACTION,
+                mode=selector.SelectSelectorMode.LIST,
             )
+        )
+
+        return self.async_show_form(
+            step_id="faces_page",
+            data_schema=vol.Schema(schema_dict),
+            description_placeholders={
+                "page": str(self._page + 1),
+                "pages": str(pages),
+                "total": str(len(self._filtered)),
+                "changes": str(len(self._face_changes)),
+            },
+        )
 
-        # Collect face list from coordinator
+    async def _async_load_faces(self) -> None:
+        """Load face names and person entities once per flow."""
         face_list = await self._get_face_list()
+        # Build unique face names (one person may have multiple face IDs)
+        self._face_names = sorted(
+            {name for name in face_list.values() if name}, key=str.casefold
+        )
+        self._filtered = self._face_names
 
-        # Collect person entities
-        persons = list(self.hass.states.async_all("person"))
+        persons = self.hass.states.async_all("person")
+        self._persons_by_name = {
+            state.name.casefold(): state.entity_id for state in persons
+        }
         person_options = [
             {"value": state.entity_id, "label": state.name} for state in persons
         ]
         # Allow clearing mapping
         person_options.insert(0, {"value": "", "label": "None"})
+        self._person_selector = selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=person_options,
+                multiple=False,
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            )
+        )
+
+    def _page_faces(self) -> list[str]:
+        """Return the face names on the current page."""
+        start = self._page * FACES_PAGE_SIZE
+        return self._filtered[start : start + FACES_PAGE_SIZE]
 
+    def _face_default(self, face_name: str) -> str:
+        """Return the pending, saved or suggested person for a face."""
+        if face_name in self._face_changes:
+            return self._face_changes[face_name]
         existing = self._config_entry.options.get(CONF_FACE_NAME_MAP, {})
-        schema_dict: dict[vol.Optional, object] = {}
-        # Build unique face names (one person may have multiple face IDs)
-        face_names = sorted({name for name in face_list.values() if name})
-        for face_name in face_names:
-            schema_dict[
-                vol.Optional(face_name, default=existing.get(face_name, ""))
-            ] = selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=person_options,
-                    multiple=False,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
-            )
+        if face_name in existing or not self._suggest:
+            return existing.get(face_name, "")
+        matches = difflib.get_close_matches(
+            face_name.casefold(),
+            self._persons_by_name,
+            n=1,
+            cutoff=FACE_SUGGEST_CUTOFF,
+        )
+        return self._persons_by_name[matches[0]] if matches else ""
 
-        return self.async_show_form(
-            step_id="init",
-            data_schema=vol.Schema(schema_dict),
-            description_placeholders={"faces": ", ".join(face_list.values()) or "none"},
+    def _record_face_changes(self, user_input: dict[str, Any]) -> None:
+        """Keep only the mappings on this page that differ from the saved ones."""
+        existing = self._config_entry.options.get(CONF_FACE_NAME_MAP, {})
+        for face_name in self._page_faces():
+            if face_name not in user_input:
+                continue
+            value = user_input[face_name]
+            if value != existing.get(face_name, ""):
+                self._face_changes[face_name] = value
+            else:
+                self._face_changes.pop(face_name, None)
+
+    @config_entries.callback
+    def _async_save_faces(self) -> FlowResult:
+        """Apply the changed mappings on top of the saved ones."""
+        face_name_map = dict(self._config_entry.options.get(CONF_FACE_NAME_MAP, {}))
+        for face_name, person in self._face_changes.items():
+            if person:
+                face_name_map[face_name] = person
+            else:
+                face_name_map.pop(face_name, None)
+        return self.async_create_entry(
+            title="",
+            data={**self._config_entry.options, CONF_FACE_NAME_MAP: face_name_map},
         )
@@ -14,8 +14,39 @@ CONF_FACE_NAME_MAP = "face_name_map"
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 CONF_AREA = "area"
+CONF_PUSH_MODE = "push_mode"
+CONF_FACE_EXPIRY = "face_expiry"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_WEBHOOK_ID = "webhook_id"
+CONF_EVENT_RESOURCES = "event_resources"
+CONF_EVENT_INTERVAL = "event_interval"
+CONF_JOURNAL_RETENTION = "journal_retention"
+CONF_PRESENCE_HOLD = "presence_hold"
+CONF_RSSI_DEADBAND = "rssi_deadband"
+CONF_RSSI_WINDOW = "rssi_window"
+CONF_RSSI_REPORT_INTERVAL = "rssi_report_interval"
+
+# Options flow face mapping fields
+CONF_SEARCH = "search"
+CONF_SUGGEST = "suggest"
+CONF_FACE_ACTION = "face_action"
+FACE_ACTION_NEXT = "next"
+FACE_ACTION_PREVIOUS = "previous"
+FACE_ACTION_SEARCH = "search"
+FACE_ACTION_SAVE = "save"
 
 SERVICE_REFRESH_FACE_LIST = "refresh_face_list"
+SERVICE_SET_RESOURCES = "set_resources"
+SERVICE_GET_STATE = "get_state"
+SERVICE_QUERY_EVENTS = "query_events"
+
+# hass.data keys shared across config entries
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+DATA_RATE_LIMITERS = f"{DOMAIN}_rate_limiters"
+DATA_REQUEST_QUEUES = f"{DOMAIN}_request_queues"
+DATA_LATENCY = f"{DOMAIN}_latency"
+DATA_JOURNAL = f"{DOMAIN}_journal"
+DATA_PRESENCE = f"{DOMAIN}_presence"
 
 # API endpoints
 API_BASE_URL = "https://{url}/app/v1.0"
@@ -26,10 +57,57 @@ API_VIEW_DATA_QUERY = "/lumi/app/view/data/query"
 API_FACE_INFO = "/lumi/devex/face/info"
 API_HISTORY_LOG = "/lumi/res/history/log"
 
+# History log
+FACE_EVENT_RESOURCE_ID = "13.95.85"
+# "type=resource_id" pairs read by the event lane; other types are opt-in
+DEFAULT_EVENT_RESOURCES = f"face={FACE_EVENT_RESOURCE_ID}"
+HISTORY_START_TIME = 1514736000000
+
+# Polling lanes: each group of resource attrs is refreshed at its own pace
+LANE_EVENT = "event"
+LANE_STATUS = "status"
+LANE_SETTINGS = "settings"
+
+STATUS_ATTRS: tuple[str, ...] = (
+    "set_video",
+    "alarm_status",
+    "device_wifi_rssi",
+)
+SETTINGS_ATTRS: tuple[str, ...] = (
+    "ptz_cruise_enable",
+    "pets_track_enable",
+    "humans_track_enable",
+    "gesture_detect_enable",
+    "mdtrigger_enable",
+    "soundtrigger_enable",
+    "human_detect_enable",
+    "face_detect_enable",
+    "pets_detect_enable",
+    "sdcard_status",
+    "system_volume",
+    "alarm_bell_index",
+    "device_night_tip_light",
+    "cloud_small_video",
+    "alarm_bell_volume",
+    "gateway_deletion_setting",
+)
+
 # Default values
 DEFAULT_AQARA_URL = "open-cn.aqara.com"
+DEFAULT_FACE_EXPIRY = 5  # minutes
+DEFAULT_RATE_LIMIT = 5.0  # requests per second per region server
+DEFAULT_RATE_BURST = 10
+DEFAULT_RSSI_DEADBAND = 2  # dBm
+DEFAULT_RSSI_WINDOW = 5  # samples
+DEFAULT_RSSI_REPORT_INTERVAL = 0  # minutes, 0 = no throttle
+DEFAULT_JOURNAL_RETENTION = 30  # days
+DEFAULT_PRESENCE_HOLD = 5  # minutes
+DEFAULT_EVENT_INTERVAL = 5  # seconds
 
 # Aqara account regions (for token auto-fetch)
+# Pseudo area that probes every region server for the account
+AREA_AUTO = "AUTO"
+
 AQARA_AREA_MAP: dict[str, dict[str, str]] = {
     "CN": {
         "server": "https://aiot-rpc.aqara.cn",
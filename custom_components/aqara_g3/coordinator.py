@@ -1,26 +1,128 @@
 """Data update coordinator for Aqara Camera G3."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import replace
+from datetime import datetime, timedelta
+from functools import partial
 import time
+from types import MappingProxyType
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import AqaraG3API
-from .const import CONF_FACE_MAP, CONF_FACE_NAME_MAP, DOMAIN
+from .const import (
+    CONF_EVENT_INTERVAL,
+    CONF_EVENT_RESOURCES,
+    CONF_FACE_EXPIRY,
+    CONF_FACE_MAP,
+    CONF_FACE_NAME_MAP,
+    CONF_JOURNAL_RETENTION,
+    CONF_PRESENCE_HOLD,
+    CONF_PUSH_MODE,
+    DEFAULT_EVENT_INTERVAL,
+    DEFAULT_EVENT_RESOURCES,
+    DEFAULT_FACE_EXPIRY,
+    DEFAULT_JOURNAL_RETENTION,
+    DEFAULT_PRESENCE_HOLD,
+    DOMAIN,
+    LANE_EVENT,
+    LANE_SETTINGS,
+    LANE_STATUS,
+    SETTINGS_ATTRS,
+    STATUS_ATTRS,
+)
+from .identity import FaceIdentityIndex
+from .journal import JournalEvent, async_get_journal
+from .models import (
+    CameraSnapshot,
+    DeviceStatus,
+    FaceEvent,
+    FaceInfo,
+    HistoryPage,
+    parse_attr_map,
+    parse_event_resources,
+    parse_face_map,
+    parse_history_list,
+    parse_last_face_id,
+    parse_last_face_ts,
+    parse_record_face_id,
+    parse_record_ts,
+    parse_scan_id,
+)
+from .latency import async_get_latency_tracker
+from .presence import async_get_presence_engine
+from .ratelimit import async_get_rate_limiter
+from .scheduler import async_get_scheduler
+from .request_queue import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    async_get_request_queue,
+)
+from .statistics import AqaraG3FaceStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=30)
+SETTINGS_INTERVAL = timedelta(hours=6)
+PUSH_RECONCILE_INTERVAL = timedelta(minutes=15)
+# Offline or video-off cameras only poll status at this pace
+HEARTBEAT_INTERVAL = timedelta(minutes=10)
+OFFLINE_AFTER_FAILURES = 3
 FACE_INFO_REFRESH_INTERVAL = timedelta(hours=12)
+# A poll running longer than this is aborted by the watchdog
+POLL_BUDGET = timedelta(seconds=60)
+# Share of a region's rate limit the event lanes of its cameras may use,
+# so status polls and interactive calls are never starved
+EVENT_RATE_SHARE = 0.5
+# Records per event lane poll when several event resources share the call
+EVENT_PAGE_SIZE = 20
+EVENT_FACE = "face"
 
 
-class AqaraG3DataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching data from the Aqara API."""
+class AqaraG3LaneCoordinator(DataUpdateCoordinator[CameraSnapshot]):
+    """A polling lane that shares the hub coordinator's API client."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        hub: AqaraG3DataUpdateCoordinator,
+        lane: str,
+        poll_interval: timedelta,
+        update_method: Callable[[], Awaitable[CameraSnapshot]],
+    ) -> None:
+        """Initialize the lane."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"Aqara G3 {lane}",
+            # Polls are driven by the shared PollScheduler
+            update_interval=None,
+            update_method=update_method,
+            # Unchanged polls return equal snapshots and notify nobody
+            always_update=False,
+        )
+        self.config_entry = hub.config_entry
+        self.hub = hub
+        self.lane = lane
+        self.poll_interval = poll_interval
+
+
+class AqaraG3DataUpdateCoordinator(DataUpdateCoordinator[CameraSnapshot]):
+    """Class to manage fetching data from the Aqara API.
+
+    The hub polls the status lane itself and owns the event and settings
+    lanes, which refresh independently at their own intervals.
+    """
 
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
@@ -28,8 +130,13 @@ class AqaraG3DataUpdateCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name="Aqara G3 Data",
-            update_interval=SCAN_INTERVAL,
+            # Polls are driven by the shared PollScheduler
+            update_interval=None,
+            # Unchanged polls return equal snapshots and notify nobody
+            always_update=False,
         )
+        push_mode = config_entry.options.get(CONF_PUSH_MODE)
+        self.poll_interval = PUSH_RECONCILE_INTERVAL if push_mode else SCAN_INTERVAL
         session = async_get_clientsession(hass)
         self.api = AqaraG3API(
             session=session,
@@ -38,57 +145,147 @@ class AqaraG3DataUpdateCoordinator(DataUpdateCoordinator):
             appid=config_entry.data["appid"],
             userid=config_entry.data.get("userid"),
             subject_id=config_entry.data["subject_id"],
+            limiter=async_get_rate_limiter(hass, config_entry.data["aqara_url"]),
+            queue=async_get_request_queue(
+                hass, config_entry.data.get("userid") or config_entry.entry_id
+            ),
+            latency=async_get_latency_tracker(hass, config_entry.data["aqara_url"]),
         )
         self.config_entry = config_entry
+        self.lane = LANE_STATUS
+        self.event_lane = AqaraG3LaneCoordinator(
+            hass,
+            self,
+            LANE_EVENT,
+            PUSH_RECONCILE_INTERVAL
+            if push_mode
+            else timedelta(
+                seconds=config_entry.options.get(
+                    CONF_EVENT_INTERVAL, DEFAULT_EVENT_INTERVAL
+                )
+            ),
+            partial(self._async_watchdog, LANE_EVENT, self._async_update_events),
+        )
+        self.settings_lane = AqaraG3LaneCoordinator(
+            hass,
+            self,
+            LANE_SETTINGS,
+            SETTINGS_INTERVAL,
+            partial(self._async_watchdog, LANE_SETTINGS, self._async_update_settings),
+        )
+        self.lanes: dict[str, DataUpdateCoordinator[CameraSnapshot]] = {
+            LANE_EVENT: self.event_lane,
+            LANE_STATUS: self,
+            LANE_SETTINGS: self.settings_lane,
+        }
+        self._lane_refreshes: dict[str, asyncio.Task[None]] = {}
+        try:
+            self.event_resources = parse_event_resources(
+                config_entry.options.get(CONF_EVENT_RESOURCES, DEFAULT_EVENT_RESOURCES)
+            )
+        except ValueError as err:
+            _LOGGER.warning("Ignoring event resources option: %s", err)
+            self.event_resources = parse_event_resources(DEFAULT_EVENT_RESOURCES)
+        self.watchdog_aborts = 0
+        # When the status lane last polled, and when pushes or writes merged attrs
+        self.status_polled_at = 0.0
+        self._attrs_merged_at: dict[str, float] = {}
+        self._failures = 0
+        self.online = True
+        self.idle = False
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+            name="Aqara Camera G3",
+            manufacturer="Aqara",
+            model="Camera G3",
+            configuration_url="https://home.aqara.com",
+        )
         self._logged_first_response = False
         self._face_map: dict[str, str] = {}
         self._last_face_info_fetch: float | None = None
         self._logged_face_event_empty = False
+        self._last_face_ts_seen: int | None = None
+        self._face_expiry = timedelta(
+            minutes=config_entry.options.get(CONF_FACE_EXPIRY, DEFAULT_FACE_EXPIRY)
+        )
+        self._unsub_face_expiry: CALLBACK_TYPE | None = None
+        self.face_active = False
+        config_entry.async_on_unload(self._async_cancel_face_expiry)
+        self._face_options = self._get_face_options(config_entry.options)
+        self._other_options = self._get_other_options(config_entry.options)
+        self.face_index = FaceIdentityIndex(hass, self._async_face_index_changed)
+        self._async_rebuild_face_index()
+        config_entry.async_on_unload(self.face_index.async_stop)
+        self.journal = async_get_journal(hass)
+        self.presence = async_get_presence_engine(hass)
+        self._presence_hold = timedelta(
+            minutes=config_entry.options.get(CONF_PRESENCE_HOLD, DEFAULT_PRESENCE_HOLD)
+        )
+        self._journal_retention = timedelta(
+            days=config_entry.options.get(
+                CONF_JOURNAL_RETENTION, DEFAULT_JOURNAL_RETENTION
+            )
+        )
+        self.statistics: AqaraG3FaceStatistics | None = None
+        if "recorder" in hass.config.components:
+            self.statistics = AqaraG3FaceStatistics(hass, self)
 
-    async def _async_update_data(self) -> dict:
-        """Fetch data from Aqara API."""
-        try:
-            data = await self.api.get_device_status()
-            attrs = self._extract_attr_map(data)
-            last_face_id = None
-            last_face_ts = None
-            last_face_name = None
+    @property
+    def face_map(self) -> dict[str, str]:
+        """Return the cached face id -> name map."""
+        return self._face_map
 
-            # Enrich with face list (refresh every 12h) + last face event
-            await self._maybe_refresh_face_map()
+    @property
+    def face_names(self) -> set[str]:
+        """Return the distinct enrolled face names."""
+        return {name for name in self._face_map.values() if name}
+
+    async def _async_update_data(self) -> CameraSnapshot:
+        """Fetch the status lane under the poll watchdog."""
+        return await self._async_watchdog(LANE_STATUS, self._async_update_status)
 
-            try:
-                face_event = await self.api.get_last_face_event()
-                last_face_id = self._extract_last_face_id(face_event)
-                last_face_ts = self._extract_last_face_ts(face_event)
-                if last_face_id and self._face_map:
-                    last_face_name = self._face_map.get(last_face_id)
-                if last_face_id is None and not self._logged_face_event_empty:
-                    _LOGGER.warning("Aqara G3 FACE EVENT EMPTY: %s", face_event)
-                    self._logged_face_event_empty = True
-            except Exception as err:
-                _LOGGER.debug("Failed to fetch face history: %s", err)
-
-            if last_face_id:
-                attrs["last_face_id"] = last_face_id
-            if last_face_ts:
-                attrs["last_face_ts"] = last_face_ts
-            if last_face_name:
-                attrs["last_face_name"] = last_face_name
-            # Map face id to HA person if configured
-            # Prefer mapping by face name, fallback to face id
-            face_name_map = self.config_entry.options.get(CONF_FACE_NAME_MAP, {})
-            face_id_map = self.config_entry.options.get(CONF_FACE_MAP, {})
-            person_entity_id = None
-            if last_face_name and face_name_map:
-                person_entity_id = face_name_map.get(str(last_face_name))
-            if not person_entity_id and last_face_id and face_id_map:
-                person_entity_id = face_id_map.get(str(last_face_id))
-            if person_entity_id:
-                state = self.hass.states.get(person_entity_id)
-                attrs["last_face_person"] = (
-                    state.name if state and state.name else person_entity_id
+    async def _async_watchdog(
+        self, lane: str, update: Callable[[], Awaitable[CameraSnapshot]]
+    ) -> CameraSnapshot:
+        """Run a lane update, aborting it once it exceeds POLL_BUDGET."""
+        budget = POLL_BUDGET.total_seconds()
+        try:
+            async with asyncio.timeout(budget):
+                return await update()
+        except TimeoutError as err:
+            self.watchdog_aborts += 1
+            _LOGGER.warning(
+                "Aqara G3 %s %s poll exceeded its %ss budget and was aborted",
+                self.config_entry.title,
+                lane,
+                budget,
+            )
+            raise UpdateFailed(f"{lane} poll exceeded {budget}s") from err
+
+    async def _async_update_status(self) -> CameraSnapshot:
+        """Fetch the status lane from Aqara API."""
+        try:
+            # After a failure, parse the next answer even if it is unchanged
+            data = await self.api.get_device_status(
+                STATUS_ATTRS,
+                skip_unchanged=self.data is not None and not self._failures,
+            )
+            if data is None:
+                # Same bytes as the last poll, nothing to parse or notify
+                self._failures = 0
+                self.online = True
+                # The camera may be coming back from the offline heartbeat
+                self._async_update_idle(self.data.status)
+                self.status_polled_at = time.monotonic()
+                return replace(self.data, fetched_at=self.status_polled_at)
+            code = data.get("code") if isinstance(data, dict) else None
+            if code not in (None, 0):
+                # Aqara answers some failures with HTTP 200 and an error code
+                raise ConnectionError(
+                    f"Status query rejected: {data.get('message')} (code: {code})"
                 )
+            status = DeviceStatus.from_response(data)
+
             if not self._logged_first_response:
                 self._logged_first_response = True
                 result = data.get("result") if isinstance(data, dict) else None
@@ -106,14 +303,438 @@ class AqaraG3DataUpdateCoordinator(DataUpdateCoordinator):
                 )
                 _LOGGER.debug(
                     "Aqara G3 normalized attrs: count=%s, keys=%s",
-                    len(attrs),
-                    list(attrs.keys()) if attrs else None,
+                    len(status.attrs),
+                    list(status.attrs) if status.attrs else None,
                 )
-            return attrs
+            self._failures = 0
+            self.online = True
+            self._async_update_idle(status.attrs)
+            self.status_polled_at = time.monotonic()
+            return CameraSnapshot(status.attrs, fetched_at=self.status_polled_at)
         except Exception as err:
+            self._failures += 1
+            if self._failures >= OFFLINE_AFTER_FAILURES:
+                self.online = False
+                self._async_update_idle(self.data.status if self.data else {})
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-    async def _maybe_refresh_face_map(self) -> None:
+    async def _async_update_settings(self) -> CameraSnapshot:
+        """Fetch the slow-changing settings lane."""
+        current = self.settings_lane.data
+        try:
+            data = await self.api.get_device_status(
+                SETTINGS_ATTRS, skip_unchanged=current is not None
+            )
+        except Exception as err:
+            raise UpdateFailed(f"Error fetching settings: {err}") from err
+        if data is None:
+            return replace(current, fetched_at=time.monotonic())
+        status = DeviceStatus.from_response(data)
+        return CameraSnapshot(status.attrs, fetched_at=time.monotonic())
+
+    async def _async_update_events(self) -> CameraSnapshot:
+        """Fetch the latest events of every event resource in one call."""
+        # An idle camera cannot produce detections
+        if self.idle and self.event_lane.data is not None:
+            return self.event_lane.data
+
+        # Enrich with face list (refresh every 12h)
+        await self._maybe_refresh_face_map()
+
+        resource_ids = tuple(dict.fromkeys(self.event_resources.values()))
+        single = resource_ids[0] if len(resource_ids) == 1 else None
+        try:
+            response = await self.api.get_event_history(
+                resource_ids,
+                size=1 if single else EVENT_PAGE_SIZE,
+                skip_unchanged=self.event_lane.data is not None,
+            )
+        except Exception as err:
+            raise UpdateFailed(f"Error fetching event history: {err}") from err
+
+        if response is None:
+            return replace(self.event_lane.data, fetched_at=time.monotonic())
+        latest = HistoryPage.from_response(response).latest_by_resource(single)
+        current = self.event_lane.data or CameraSnapshot()
+        face = current.face
+        detections = dict(current.status)
+        for event_type, resource_id in self.event_resources.items():
+            record = latest.get(resource_id)
+            if record is None:
+                continue
+            if event_type == EVENT_FACE:
+                # Never roll back a newer pushed face
+                if face is None or face.ts is None or (record.ts or 0) > face.ts:
+                    face = self._build_face_event(record.face_id, record.ts)
+            elif record.ts:
+                key = f"last_{event_type}_ts"
+                if record.ts > (detections.get(key) or 0):
+                    detections[key] = record.ts
+                    self._async_journal(event_type, record.ts)
+
+        face_record = latest.get(self.event_resources.get(EVENT_FACE, ""))
+        if (
+            EVENT_FACE in self.event_resources
+            and (face_record is None or face_record.face_id is None)
+            and not self._logged_face_event_empty
+        ):
+            _LOGGER.warning("Aqara G3 FACE EVENT EMPTY: %s", response)
+            self._logged_face_event_empty = True
+        return CameraSnapshot(
+            MappingProxyType(detections), face, fetched_at=time.monotonic()
+        )
+
+    def attr_received_at(self, attr: str) -> float:
+        """Return when a status attr last arrived from a poll, push or write."""
+        return max(self.status_polled_at, self._attrs_merged_at.get(attr, 0.0))
+
+    @property
+    def snapshot(self) -> CameraSnapshot:
+        """Return the cached state of every lane as one snapshot.
+
+        fetched_at is that of the oldest lane.
+        """
+        status: dict[str, Any] = {}
+        face = None
+        fetched = []
+        for lane in self.lanes.values():
+            if lane.data is None:
+                continue
+            status.update(lane.data.status)
+            face = lane.data.face or face
+            fetched.append(lane.data.fetched_at)
+        return CameraSnapshot(MappingProxyType(status), face, min(fetched, default=0.0))
+
+    async def async_get_snapshot(self, max_age: float | None = None) -> CameraSnapshot:
+        """Return the cached snapshot, refreshing lanes older than max_age."""
+        if max_age is not None:
+            now = time.monotonic()
+            stale = [
+                lane
+                for lane in self.lanes.values()
+                if lane.data is None or now - lane.data.fetched_at > max_age
+            ]
+            await asyncio.gather(*(self._async_refresh_lane(lane) for lane in stale))
+        return self.snapshot
+
+    async def _async_refresh_lane(
+        self, lane: DataUpdateCoordinator[CameraSnapshot]
+    ) -> None:
+        """Refresh a lane, joining a refresh that is already running."""
+        task = self._lane_refreshes.get(lane.lane)
+        if task is None or task.done():
+            task = self.hass.async_create_task(lane.async_refresh())
+            self._lane_refreshes[lane.lane] = task
+        await asyncio.shield(task)
+
+    async def async_refresh_lanes(self) -> None:
+        """Refresh the secondary lanes without failing setup."""
+        await self.event_lane.async_refresh()
+        await self.settings_lane.async_refresh()
+
+    @callback
+    def async_handle_push(
+        self,
+        attrs: dict[str, object],
+        face_events: list[tuple[str, int]],
+        detections: Mapping[str, int] | None = None,
+    ) -> None:
+        """Merge pushed attrs, face events and detections into their lanes."""
+        now = time.monotonic()
+        self._async_merge_attrs(attrs)
+
+        current = self.event_lane.data or CameraSnapshot()
+        face = current.face
+        changed = False
+        if face_events:
+            face_id, face_ts = max(face_events, key=lambda event: event[1])
+            if face is None or face.ts is None or face_ts > face.ts:
+                face = self._build_face_event(face_id, face_ts)
+                changed = True
+
+        status = dict(current.status)
+        for key, ts in (detections or {}).items():
+            if ts > (status.get(key) or 0):
+                status[key] = ts
+                changed = True
+                # Keys are "last_<type>_ts"
+                self._async_journal(key[5:-3], ts)
+
+        if changed:
+            self.event_lane.async_set_updated_data(
+                CameraSnapshot(MappingProxyType(status), face, fetched_at=now)
+            )
+
+    @callback
+    def _async_merge_attrs(self, attrs: Mapping[str, Any]) -> None:
+        """Merge resource attrs into the status and settings lanes."""
+        now = time.monotonic()
+        self._attrs_merged_at.update(dict.fromkeys(attrs, now))
+        for lane in (self, self.settings_lane):
+            lane_attrs = {
+                key: value
+                for key, value in attrs.items()
+                if (key in SETTINGS_ATTRS) == (lane is self.settings_lane)
+            }
+            if lane_attrs:
+                current = lane.data or CameraSnapshot()
+                status = MappingProxyType({**current.status, **lane_attrs})
+                lane.async_set_updated_data(CameraSnapshot(status, fetched_at=now))
+                if lane is self:
+                    self._async_update_idle(status)
+
+    async def async_shutdown(self) -> None:
+        """Stop polling, cancel in-flight requests and flush the journal."""
+        scheduler = async_get_scheduler(self.hass)
+        for lane in self.lanes.values():
+            scheduler.async_unregister(self._poll_key(lane))
+        for task in self._lane_refreshes.values():
+            task.cancel()
+        self._lane_refreshes.clear()
+        # The remaining cameras of the region may poll events faster again
+        self._async_rebalance_event_lanes()
+        await super().async_shutdown()
+        await self.event_lane.async_shutdown()
+        await self.settings_lane.async_shutdown()
+        await self.api.async_close()
+        await self.journal.async_flush()
+
+    @callback
+    def async_schedule_polls(self) -> None:
+        """Register every lane with the shared poll scheduler."""
+        scheduler = async_get_scheduler(self.hass)
+        for lane in self.lanes.values():
+            self.config_entry.async_on_unload(
+                scheduler.async_register(
+                    self._poll_key(lane), self._lane_interval(lane), lane.async_refresh
+                )
+            )
+        self._async_rebalance_event_lanes()
+
+    def _region_hubs(self) -> list[AqaraG3DataUpdateCoordinator]:
+        """Return the loaded cameras sharing this camera's rate limiter."""
+        return [
+            data["coordinator"]
+            for data in self.hass.data.get(DOMAIN, {}).values()
+            if isinstance(data, dict)
+            and isinstance(data.get("coordinator"), AqaraG3DataUpdateCoordinator)
+            and data["coordinator"].api.limiter is self.api.limiter
+        ]
+
+    @callback
+    def _async_rebalance_event_lanes(self) -> None:
+        """Re-apply the event interval of every camera in the region."""
+        scheduler = async_get_scheduler(self.hass)
+        for hub in self._region_hubs():
+            scheduler.async_set_interval(
+                hub._poll_key(hub.event_lane), hub._lane_interval(hub.event_lane)
+            )
+
+    def _event_interval_floor(self) -> timedelta:
+        """Return the shortest event interval the region's rate limit allows.
+
+        Each camera's event lane costs one request per poll, so the region's
+        event lanes together stay within EVENT_RATE_SHARE of its rate.
+        """
+        limiter = self.api.limiter
+        if limiter is None:
+            return timedelta(0)
+        cameras = max(1, len(self._region_hubs()))
+        return timedelta(seconds=cameras / (limiter.rate * EVENT_RATE_SHARE))
+
+    def _poll_key(self, lane: DataUpdateCoordinator[CameraSnapshot]) -> str:
+        """Return the scheduler key of a lane."""
+        return f"{self.config_entry.entry_id}_{lane.lane}"
+
+    def _lane_interval(self, lane: DataUpdateCoordinator[CameraSnapshot]) -> timedelta:
+        """Return the poll interval of a lane, slowed down while idle."""
+        if self.idle and lane is not self.settings_lane:
+            return max(HEARTBEAT_INTERVAL, lane.poll_interval)
+        if lane is self.event_lane:
+            return max(lane.poll_interval, self._event_interval_floor())
+        return lane.poll_interval
+
+    @callback
+    def _async_update_idle(self, status: Mapping[str, Any]) -> None:
+        """Slow down polling while the camera is offline or its video is off."""
+        video = status.get("set_video")
+        video_off = video is not None and str(video).lower() in ("0", "false")
+        idle = not self.online or video_off
+        if idle == self.idle:
+            return
+        self.idle = idle
+        _LOGGER.debug(
+            "Aqara G3 %s is %s, %s polling",
+            self.config_entry.title,
+            "offline" if not self.online else "video off" if video_off else "active",
+            "pausing" if idle else "resuming",
+        )
+        scheduler = async_get_scheduler(self.hass)
+        for lane in (self, self.event_lane):
+            scheduler.async_set_interval(self._poll_key(lane), self._lane_interval(lane))
+        if not idle:
+            self.config_entry.async_create_background_task(
+                self.hass, self.event_lane.async_refresh(), "aqara_g3_resume_events"
+            )
+
+    async def async_write_resources(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Write resource attrs and re-read only those attrs.
+
+        Returns the values reported by the camera after the write.
+        """
+        await self.api.write_resources(attrs)
+        data = await self.api.get_device_status(
+            tuple(attrs), priority=PRIORITY_INTERACTIVE
+        )
+        values = dict(DeviceStatus.from_response(data).attrs)
+        self._async_merge_attrs(values)
+        return values
+
+    def _build_face_event(
+        self, last_face_id: str | None, last_face_ts: int | None
+    ) -> FaceEvent:
+        """Resolve the last face id to its name and mapped person."""
+        last_face_name, last_face_person = self.face_index.lookup(last_face_id)
+        face = FaceEvent(last_face_id, last_face_ts, last_face_name, last_face_person)
+        if last_face_ts and last_face_ts != self._last_face_ts_seen:
+            if self._last_face_ts_seen is not None and self.statistics:
+                self.config_entry.async_create_background_task(
+                    self.hass,
+                    self.statistics.async_process_new_events(),
+                    "aqara_g3_face_statistics",
+                )
+            self._last_face_ts_seen = last_face_ts
+            self._schedule_face_expiry(last_face_ts)
+            self._async_journal(EVENT_FACE, last_face_ts, face)
+            if person := self.face_index.person_entity_id(last_face_id):
+                self.presence.async_seen(
+                    person, self.config_entry.entry_id, last_face_ts, self._presence_hold
+                )
+        return face
+
+    @callback
+    def _async_journal(
+        self, event_type: str, ts: int, face: FaceEvent | None = None
+    ) -> None:
+        """Record an ingested event in the local journal."""
+        self.journal.async_add(
+            JournalEvent(
+                self.config_entry.entry_id,
+                event_type,
+                ts,
+                face.face_id if face else None,
+                face.name if face else None,
+                face.person if face else None,
+            )
+        )
+
+    async def async_prune_journal(self, _now: datetime | None = None) -> None:
+        """Delete journaled events older than the retention period."""
+        cutoff = dt_util.utcnow() - self._journal_retention
+        removed = await self.journal.async_prune(
+            self.config_entry.entry_id, int(cutoff.timestamp() * 1000)
+        )
+        if removed:
+            _LOGGER.debug("Pruned %s journaled events of %s", removed, self.config_entry.title)
+
+    @staticmethod
+    def _get_face_options(
+        options: Mapping[str, Any]
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        """Return the (face name -> person, face id -> person) mapping options."""
+        return (
+            dict(options.get(CONF_FACE_NAME_MAP, {})),
+            dict(options.get(CONF_FACE_MAP, {})),
+        )
+
+    @staticmethod
+    def _mapped_persons(
+        face_options: tuple[dict[str, str], dict[str, str]]
+    ) -> set[str]:
+        """Return the person entities any face is mapped to."""
+        face_name_map, face_id_map = face_options
+        return {person for person in (*face_name_map.values(), *face_id_map.values()) if person}
+
+    @property
+    def mapped_persons(self) -> set[str]:
+        """Return the person entities this camera can report as present."""
+        return self._mapped_persons(self._face_options)
+
+    @staticmethod
+    def _get_other_options(options: Mapping[str, Any]) -> dict[str, Any]:
+        """Return the options that need a reload to take effect."""
+        return {
+            key: value
+            for key, value in options.items()
+            if key not in (CONF_FACE_NAME_MAP, CONF_FACE_MAP)
+        }
+
+    @callback
+    def _async_rebuild_face_index(self) -> None:
+        """Rebuild the face identity index from the face list and options."""
+        face_name_map, face_id_map = self._face_options
+        self.face_index.async_rebuild(self._face_map, face_name_map, face_id_map)
+
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> bool:
+        """Hot-apply face mapping options.
+
+        Returns False if any other option changed and the entry must reload.
+        """
+        if self._get_other_options(options) != self._other_options:
+            return False
+        face_options = self._get_face_options(options)
+        if self._mapped_persons(face_options) != self.mapped_persons:
+            # Presence sensors exist per mapped person
+            return False
+        if face_options != self._face_options:
+            self._face_options = face_options
+            self._async_rebuild_face_index()
+            self._async_face_index_changed()
+        return True
+
+    @callback
+    def _async_face_index_changed(self) -> None:
+        """Re-resolve the current face event after the index changed."""
+        current = self.event_lane.data
+        if current is None or current.face is None:
+            return
+        name, person = self.face_index.lookup(current.face.face_id)
+        if (name, person) != (current.face.name, current.face.person):
+            # Keep the detection timestamps held in status
+            self.event_lane.async_set_updated_data(
+                replace(current, face=replace(current.face, name=name, person=person))
+            )
+
+    def _schedule_face_expiry(self, last_face_ts: int) -> None:
+        """Mark the face event active and schedule its exact expiry."""
+        self._async_cancel_face_expiry()
+        expires_at = dt_util.utc_from_timestamp(last_face_ts / 1000) + self._face_expiry
+        if expires_at <= dt_util.utcnow():
+            self.face_active = False
+            return
+        self.face_active = True
+        self._unsub_face_expiry = async_track_point_in_utc_time(
+            self.hass, self._async_expire_face, expires_at
+        )
+
+    @callback
+    def _async_expire_face(self, _now: datetime) -> None:
+        """Hide the last face once its display window has passed."""
+        self._unsub_face_expiry = None
+        self.face_active = False
+        self.event_lane.async_update_listeners()
+
+    @callback
+    def _async_cancel_face_expiry(self) -> None:
+        """Cancel a pending face expiry timer."""
+        if self._unsub_face_expiry:
+            self._unsub_face_expiry()
+            self._unsub_face_expiry = None
+
+    async def _maybe_refresh_face_map(
+        self, priority: int = PRIORITY_BACKGROUND
+    ) -> None:
         """Refresh face map at startup or every 12 hours."""
         now = time.monotonic()
         if (
@@ -123,9 +744,14 @@ class AqaraG3DataUpdateCoordinator(DataUpdateCoordinator):
             return
 
         try:
-            face_info = await self.api.get_face_info()
-            self._face_map = self._extract_face_map(face_info)
+            face_info = await self.api.get_face_info(priority)
+            face_map = dict(FaceInfo.from_response(face_info).faces)
             self._last_face_info_fetch = now
+            if face_map != self._face_map:
+                self._face_map = face_map
+                self._async_rebuild_face_index()
+                # An unchanged history poll will not rebuild the face event
+                self._async_face_index_changed()
         except Exception as err:
             _LOGGER.debug("Failed to refresh face info: %s", err)
 
@@ -133,146 +759,17 @@ class AqaraG3DataUpdateCoordinator(DataUpdateCoordinator):
         """Return face map, optionally forcing refresh."""
         if force_refresh:
             self._last_face_info_fetch = None
-        await self._maybe_refresh_face_map()
-        return dict(self._face_map)
-
-    @staticmethod
-    def _extract_attr_map(data: dict | None) -> dict:
-        """Normalize API response into a flat attr->value dict."""
-        if not isinstance(data, dict):
-            return {}
-
-        result = data.get("result")
-        attrs: dict[str, object] = {}
-
-        # Case 1: result is a list of {attr, value}
-        if isinstance(result, list):
-            for item in result:
-                if isinstance(item, dict) and "attr" in item:
-                    attrs[item["attr"]] = item.get("value")
-            return attrs
-
-        # Case 2: result is a dict with resultList
-        if isinstance(result, dict):
-            result_list = result.get("resultList")
-            if isinstance(result_list, list) and result_list:
-                # If result_list[0] is a dict of keys -> {value}
-                first = result_list[0]
-                if isinstance(first, dict) and "attr" not in first:
-                    for key, value in first.items():
-                        if isinstance(value, dict) and "value" in value:
-                            attrs[key] = value.get("value")
-                        else:
-                            attrs[key] = value
-                    return attrs
-
-                # Otherwise treat as list of {attr, value}
-                for item in result_list:
-                    if isinstance(item, dict) and "attr" in item:
-                        attrs[item["attr"]] = item.get("value")
-                return attrs
-
-            # If result itself is a map of key -> {value}
-            for key, value in result.items():
-                if isinstance(value, dict) and "value" in value:
-                    attrs[key] = value.get("value")
-                else:
-                    attrs[key] = value
-            return attrs
-
-        # Case 3: fallback to top-level resultList
-        result_list = data.get("resultList")
-        if isinstance(result_list, list):
-            for item in result_list:
-                if isinstance(item, dict) and "attr" in item:
-                    attrs[item["attr"]] = item.get("value")
-        return attrs
-
-    @staticmethod
-    def _extract_face_map(data: dict | None) -> dict[str, str]:
-        """Extract face id -> name map from face info response."""
-        if not isinstance(data, dict):
-            return {}
-
-        result = data.get("result")
-        if isinstance(result, dict):
-            face_list = result.get("faceList") or result.get("list") or []
-        elif isinstance(result, list):
-            face_list = result
+            await self._maybe_refresh_face_map(PRIORITY_INTERACTIVE)
         else:
-            face_list = data.get("faceList") or data.get("list") or []
-
-        face_map: dict[str, str] = {}
-        if isinstance(face_list, list):
-            for item in face_list:
-                if not isinstance(item, dict):
-                    continue
-                face_id = item.get("faceId") or item.get("id")
-                face_id_str = item.get("faceIdStr")
-                name = item.get("name") or item.get("faceName")
-                if name:
-                    if face_id:
-                        face_map[str(face_id)] = str(name)
-                    if face_id_str:
-                        face_map[str(face_id_str)] = str(name)
-        return face_map
-
-    @staticmethod
-    def _extract_last_face_id(data: dict | None) -> str | None:
-        """Extract the last face id from history log response."""
-        if not isinstance(data, dict):
-            return None
-
-        result = data.get("result")
-        if isinstance(result, dict):
-            history_list = (
-                result.get("data")
-                or result.get("history")
-                or result.get("list")
-                or result.get("resultList")
-                or []
-            )
-        elif isinstance(result, list):
-            history_list = result
-        else:
-            history_list = data.get("history") or data.get("list") or []
-
-        if isinstance(history_list, list) and history_list:
-            item = history_list[0]
-            if isinstance(item, dict):
-                return (
-                    item.get("faceId")
-                    or item.get("faceIdStr")
-                    or item.get("value")
-                    or item.get("data")
-                    or item.get("attrValue")
-                )
-        return None
+            await self._maybe_refresh_face_map()
+        return dict(self._face_map)
 
-    @staticmethod
-    def _extract_last_face_ts(data: dict | None) -> int | None:
-        """Extract the timestamp (ms) of the last face event."""
-        if not isinstance(data, dict):
-            return None
-
-        result = data.get("result")
-        if isinstance(result, dict):
-            history_list = (
-                result.get("data")
-                or result.get("history")
-                or result.get("list")
-                or result.get("resultList")
-                or []
-            )
-        elif isinstance(result, list):
-            history_list = result
-        else:
-            history_list = data.get("history") or data.get("list") or []
-
-        if isinstance(history_list, list) and history_list:
-            item = history_list[0]
-            if isinstance(item, dict):
-                ts = item.get("timeStamp") or item.get("timestamp")
-                if isinstance(ts, (int, float)):
-                    return int(ts)
-        return None
+    # Response parsers live in models.py; kept here under their historic names
+    _extract_attr_map = staticmethod(parse_attr_map)
+    _extract_face_map = staticmethod(parse_face_map)
+    _extract_history_list = staticmethod(parse_history_list)
+    _extract_scan_id = staticmethod(parse_scan_id)
+    _extract_record_face_id = staticmethod(parse_record_face_id)
+    _extract_record_ts = staticmethod(parse_record_ts)
+    _extract_last_face_id = staticmethod(parse_last_face_id)
+    _extract_last_face_ts = staticmethod(parse_last_face_ts)
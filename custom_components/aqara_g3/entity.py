@@ -0,0 +1,101 @@
+"""Base entity for Aqara Camera G3."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
+
+from .const import LANE_STATUS
+from .coordinator import AqaraG3DataUpdateCoordinator
+from .models import CameraSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+_TRUE_STRINGS = frozenset(("1", "true", "yes", "on"))
+
+
+def to_bool(value: Any) -> bool:
+    """Convert "0"/"1", 0/1, "true"/"false" and bools to bool."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in _TRUE_STRINGS
+    return bool(value)
+
+
+def to_int(value: Any) -> int | None:
+    """Convert a value to int, or None if it is not numeric."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        _LOGGER.debug("Error converting value %s to int", value)
+        return None
+
+
+def to_str(value: Any) -> str:
+    """Convert a value to str."""
+    return str(value)
+
+
+def passthrough(value: Any) -> Any:
+    """Return the value unchanged."""
+    return value
+
+
+CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    bool: to_bool,
+    int: to_int,
+    str: to_str,
+}
+
+
+class AqaraG3Entity(CoordinatorEntity[DataUpdateCoordinator[CameraSnapshot]]):
+    """Common base for Aqara Camera G3 entities.
+
+    Entities listen to a single polling lane of the hub coordinator, so a
+    fast lane update never rewrites entities that belong to a slower one.
+    """
+
+    def __init__(
+        self,
+        coordinator: AqaraG3DataUpdateCoordinator,
+        key: str,
+        api_key: str | None = None,
+        value_type: type | None = None,
+        lane: str = LANE_STATUS,
+    ) -> None:
+        """Initialize the entity, subscribe to its lane and bind its converter."""
+        super().__init__(coordinator.lanes[lane])
+        self.hub = coordinator
+        self._key = key
+        self._api_key = api_key
+        self._convert = CONVERTERS.get(value_type, passthrough)
+        self._logged_no_data = False
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{key}"
+        self._attr_device_info = coordinator.device_info
+
+    def _get_value(self) -> Any:
+        """Return the converted lane value for this entity's api key."""
+        data = self.coordinator.data
+        if data is None:
+            return None
+
+        value = data.get(self._api_key)
+        if value is None:
+            if not self._logged_no_data:
+                _LOGGER.debug(
+                    "Missing api key '%s' for %s. Available keys: %s",
+                    self._api_key,
+                    self._key,
+                    list(data.keys()),
+                )
+                self._logged_no_data = True
+            return None
+        # Reset log flag when data becomes available again
+        self._logged_no_data = False
+        return self._convert(value)
@@ -0,0 +1,112 @@
+"""Face identity index for Aqara Camera G3."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Mapping
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FaceIdentityIndex:
+    """Resolve a face id to its enrolled name and mapped person in one lookup.
+
+    The index is rebuilt only when the face list or the person mapping
+    options change. Person display names are kept current by a state
+    listener, so a rename updates every face id owned by that person.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, on_change: Callable[[], None] | None = None
+    ) -> None:
+        """Initialize an empty index."""
+        self._hass = hass
+        self._on_change = on_change
+        # face id -> (face name, person display name)
+        self._faces: dict[str, tuple[str | None, str | None]] = {}
+        # person entity id -> face ids mapped to it
+        self._face_ids_by_person: dict[str, set[str]] = {}
+        self._person_by_face_id: dict[str, str] = {}
+        self._names: dict[str, str | None] = {}
+        self._unsub_state: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_rebuild(
+        self,
+        face_map: Mapping[str, str],
+        face_name_map: Mapping[str, str],
+        face_id_map: Mapping[str, str],
+    ) -> None:
+        """Rebuild the index from the face list and mapping options."""
+        self._names = dict(face_map)
+        self._face_ids_by_person = {}
+        # Prefer mapping by face name, fallback to face id
+        for face_id in face_map.keys() | face_id_map.keys():
+            name = face_map.get(face_id)
+            person_entity_id = (face_name_map.get(name) if name else None) or (
+                face_id_map.get(face_id)
+            )
+            if person_entity_id:
+                self._face_ids_by_person.setdefault(person_entity_id, set()).add(
+                    face_id
+                )
+
+        self._person_by_face_id = {
+            face_id: person_entity_id
+            for person_entity_id, face_ids in self._face_ids_by_person.items()
+            for face_id in face_ids
+        }
+        self._faces = {face_id: (name, None) for face_id, name in face_map.items()}
+        for person_entity_id in self._face_ids_by_person:
+            self._apply_person_name(person_entity_id)
+
+        self.async_stop()
+        if self._face_ids_by_person:
+            self._unsub_state = async_track_state_change_event(
+                self._hass,
+                list(self._face_ids_by_person),
+                self._async_person_changed,
+            )
+        _LOGGER.debug(
+            "Rebuilt face identity index: %s faces, %s persons",
+            len(self._faces),
+            len(self._face_ids_by_person),
+        )
+
+    def lookup(self, face_id: str | None) -> tuple[str | None, str | None]:
+        """Return (face name, person display name) for a face id."""
+        if not face_id:
+            return None, None
+        return self._faces.get(face_id, (None, None))
+
+    def person_entity_id(self, face_id: str | None) -> str | None:
+        """Return the person entity a face id is mapped to."""
+        if not face_id:
+            return None
+        return self._person_by_face_id.get(face_id)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracking person entities."""
+        if self._unsub_state:
+            self._unsub_state()
+            self._unsub_state = None
+
+    def _apply_person_name(self, person_entity_id: str) -> None:
+        """Store the current display name of a person on its face ids."""
+        state = self._hass.states.get(person_entity_id)
+        person = state.name if state and state.name else person_entity_id
+        for face_id in self._face_ids_by_person.get(person_entity_id, ()):
+            self._faces[face_id] = (self._names.get(face_id), person)
+
+    @callback
+    def _async_person_changed(self, event: Event) -> None:
+        """Refresh the display name of a renamed person."""
+        person_entity_id = event.data["entity_id"]
+        face_ids = self._face_ids_by_person.get(person_entity_id, ())
+        before = [self._faces.get(face_id) for face_id in face_ids]
+        self._apply_person_name(person_entity_id)
+        if self._on_change and before != [self._faces[face_id] for face_id in face_ids]:
+            self._on_change()
@@ -0,0 +1,231 @@
+"""Local SQLite event journal for Aqara Camera G3."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import asyncio
+import logging
+import sqlite3
+import threading
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DATA_JOURNAL
+
+_LOGGER = logging.getLogger(__name__)
+
+JOURNAL_FILE = "aqara_g3_events.db"
+# Events arriving within this many seconds are written in one transaction
+FLUSH_DELAY = 1.0
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS events (
+        id INTEGER PRIMARY KEY,
+        camera TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        ts INTEGER NOT NULL,
+        face_id TEXT NOT NULL DEFAULT '',
+        face_name TEXT,
+        person TEXT COLLATE NOCASE,
+        UNIQUE (camera, event_type, ts, face_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS events_ts ON events (ts)",
+    "CREATE INDEX IF NOT EXISTS events_camera_ts ON events (camera, ts)",
+    "CREATE INDEX IF NOT EXISTS events_person_ts ON events (person, ts)",
+    "CREATE INDEX IF NOT EXISTS events_face_ts ON events (face_id, ts)",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class JournalEvent:
+    """One ingested camera event."""
+
+    camera: str
+    event_type: str
+    ts: int
+    face_id: str | None = None
+    face_name: str | None = None
+    person: str | None = None
+
+
+class EventJournal:
+    """Append-only event store shared by every camera.
+
+    SQLite calls run in the executor behind one lock, so the connection is
+    only ever used by one thread at a time. Once closed, the journal stays
+    closed and drops new events.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize the journal without touching the disk."""
+        self._hass = hass
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        # Orders writes before the close
+        self._write_lock = asyncio.Lock()
+        self._closed = False
+        self._pending: list[JournalEvent] = []
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._closed:
+            raise sqlite3.ProgrammingError("Event journal is closed")
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    @callback
+    def async_add(self, event: JournalEvent) -> None:
+        """Queue an event for the next batched write."""
+        if self._closed:
+            return
+        self._pending.append(event)
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self._hass, FLUSH_DELAY, self._async_flush_later
+            )
+
+    async def _async_flush_later(self, _now: Any) -> None:
+        """Write the queued events once the batch window has passed."""
+        self._unsub_flush = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write every queued event now."""
+        if self._unsub_flush:
+            self._unsub_flush()
+            self._unsub_flush = None
+        async with self._write_lock:
+            if not self._pending or self._closed:
+                return
+            events, self._pending = self._pending, []
+            try:
+                await self._hass.async_add_executor_job(self._insert, events)
+            except sqlite3.Error as err:
+                _LOGGER.warning(
+                    "Failed to write %s events to the journal: %s", len(events), err
+                )
+
+    def _insert(self, events: Iterable[JournalEvent]) -> None:
+        """Insert events, ignoring ones already journaled."""
+        # face_id is part of the unique key, so store "" rather than NULL
+        rows = [
+            (
+                event.camera,
+                event.event_type,
+                event.ts,
+                event.face_id or "",
+                event.face_name,
+                event.person,
+            )
+            for event in events
+        ]
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO events "
+                    "(camera, event_type, ts, face_id, face_name, person) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+
+    async def async_query(
+        self,
+        cameras: Iterable[str] | None = None,
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+        person: str | None = None,
+        face_id: str | None = None,
+        event_type: str | None = None,
+        limit: int = 100,
+    ) -> list[JournalEvent]:
+        """Return matching events, newest first."""
+        # Include events still waiting for their batch
+        await self.async_flush()
+        clauses: list[str] = []
+        params: list[Any] = []
+        if cameras is not None:
+            cameras = list(cameras)
+            clauses.append(f"camera IN ({', '.join('?' * len(cameras))})")
+            params.extend(cameras)
+        for clause, value in (
+            ("ts >= ?", start_ts),
+            ("ts < ?", end_ts),
+            ("person = ?", person),
+            ("face_id = ?", face_id),
+            ("event_type = ?", event_type),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            "SELECT camera, event_type, ts, face_id, face_name, person FROM events "
+            f"{where} ORDER BY ts DESC LIMIT ?"
+        )
+        params.append(limit)
+        rows = await self._hass.async_add_executor_job(self._select, sql, params)
+        return [
+            JournalEvent(camera, kind, ts, face or None, name, person)
+            for camera, kind, ts, face, name, person in rows
+        ]
+
+    def _select(self, sql: str, params: list[Any]) -> list[tuple]:
+        """Run a read query."""
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    async def async_prune(self, camera: str, before_ts: int) -> int:
+        """Delete a camera's events older than before_ts and return the count."""
+        await self.async_flush()
+        return await self._hass.async_add_executor_job(self._delete, camera, before_ts)
+
+    def _delete(self, camera: str, before_ts: int) -> int:
+        """Delete old events of one camera."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM events WHERE camera = ? AND ts < ?", (camera, before_ts)
+                )
+            return cursor.rowcount
+
+    async def async_close(self, _event: Event | None = None) -> None:
+        """Write pending events and close the database."""
+        await self.async_flush()
+        # Wait for a flush that another caller started
+        async with self._write_lock:
+            if not self._closed:
+                await self._hass.async_add_executor_job(self._close)
+
+    def _close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            self._closed = True
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+@callback
+def async_get_journal(hass: HomeAssistant) -> EventJournal:
+    """Return the shared event journal, closed when Home Assistant stops."""
+    if DATA_JOURNAL not in hass.data:
+        journal = EventJournal(hass, hass.config.path(JOURNAL_FILE))
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, journal.async_close)
+        hass.data[DATA_JOURNAL] = journal
+    return hass.data[DATA_JOURNAL]
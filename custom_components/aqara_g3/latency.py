@@ -0,0 +1,93 @@
+"""Per-endpoint latency budgets for Aqara Camera G3."""
+from __future__ import annotations
+
+import math
+from collections import deque
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_LATENCY
+
+# Samples kept per endpoint, and needed before budgets replace the defaults
+LATENCY_WINDOW = 200
+MIN_SAMPLES = 20
+
+# Timeout budget is a multiple of p99, bounded to this range (seconds)
+TIMEOUT_P99_FACTOR = 3.0
+MIN_TIMEOUT = 3.0
+
+# Never hedge sooner than this, so fast endpoints are not doubled by noise
+MIN_HEDGE_DELAY = 0.25
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    """Return the nearest-rank percentile of sorted samples."""
+    rank = max(1, math.ceil(q / 100 * len(samples)))
+    return samples[rank - 1]
+
+
+class EndpointLatency:
+    """Rolling latency window of one endpoint."""
+
+    def __init__(self, default_timeout: float) -> None:
+        """Initialize an empty window."""
+        self._default_timeout = default_timeout
+        self._samples: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._sorted: list[float] | None = None
+
+    @callback
+    def async_record(self, seconds: float) -> None:
+        """Record the duration of one request."""
+        self._samples.append(seconds)
+        self._sorted = None
+
+    def percentile(self, q: float) -> float | None:
+        """Return the q-th percentile, or None until enough samples exist."""
+        if len(self._samples) < MIN_SAMPLES:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self._samples)
+        return _percentile(self._sorted, q)
+
+    @property
+    def timeout(self) -> float:
+        """Return the total timeout budget for the next request.
+
+        Budgets only ever shrink below the default; the default stays the cap.
+        """
+        p99 = self.percentile(99)
+        if p99 is None:
+            return self._default_timeout
+        return min(self._default_timeout, max(MIN_TIMEOUT, p99 * TIMEOUT_P99_FACTOR))
+
+    @property
+    def hedge_delay(self) -> float | None:
+        """Return how long to wait before hedging, or None to not hedge yet."""
+        p95 = self.percentile(95)
+        if p95 is None:
+            return None
+        return max(MIN_HEDGE_DELAY, p95)
+
+
+class LatencyTracker:
+    """Latency windows of every endpoint on one server."""
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._endpoints: dict[str, EndpointLatency] = {}
+
+    def get(self, endpoint: str, default_timeout: float) -> EndpointLatency:
+        """Return the window of an endpoint, ignoring its query string."""
+        path = endpoint.split("?", 1)[0]
+        if path not in self._endpoints:
+            self._endpoints[path] = EndpointLatency(default_timeout)
+        return self._endpoints[path]
+
+
+@callback
+def async_get_latency_tracker(hass: HomeAssistant, server: str) -> LatencyTracker:
+    """Return the shared latency tracker for a server."""
+    trackers: dict[str, LatencyTracker] = hass.data.setdefault(DATA_LATENCY, {})
+    if server not in trackers:
+        trackers[server] = LatencyTracker()
+    return trackers[server]
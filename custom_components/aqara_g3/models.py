@@ -0,0 +1,383 @@
+"""Typed response models and parsers for Aqara Camera G3.
+
+Every supported response shape is handled here, so the rest of the
+integration works with validated, immutable objects.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Event types that can be read from the history log
+EVENT_TYPES = ("face", "motion", "human", "pet", "sound", "gesture")
+
+
+def parse_attr_map(data: dict | None) -> dict:
+    """Normalize API response into a flat attr->value dict."""
+    if not isinstance(data, dict):
+        return {}
+
+    result = data.get("result")
+    attrs: dict[str, object] = {}
+
+    # Case 1: result is a list of {attr, value}
+    if isinstance(result, list):
+        for item in result:
+            if isinstance(item, dict) and isinstance(item.get("attr"), str):
+                attrs[item["attr"]] = item.get("value")
+        return attrs
+
+    # Case 2: result is a dict with resultList
+    if isinstance(result, dict):
+        result_list = result.get("resultList")
+        if isinstance(result_list, list) and result_list:
+            # If result_list[0] is a dict of keys -> {value}
+            first = result_list[0]
+            if isinstance(first, dict) and "attr" not in first:
+                for key, value in first.items():
+                    if isinstance(value, dict) and "value" in value:
+                        attrs[key] = value.get("value")
+                    else:
+                        attrs[key] = value
+                return attrs
+
+            # Otherwise treat as list of {attr, value}
+            for item in result_list:
+                if isinstance(item, dict) and isinstance(item.get("attr"), str):
+                    attrs[item["attr"]] = item.get("value")
+            return attrs
+
+        # If result itself is a map of key -> {value}
+        for key, value in result.items():
+            if isinstance(value, dict) and "value" in value:
+                attrs[key] = value.get("value")
+            else:
+                attrs[key] = value
+        return attrs
+
+    # Case 3: fallback to top-level resultList
+    result_list = data.get("resultList")
+    if isinstance(result_list, list):
+        for item in result_list:
+            if isinstance(item, dict) and isinstance(item.get("attr"), str):
+                attrs[item["attr"]] = item.get("value")
+    return attrs
+
+
+def parse_face_map(data: dict | None) -> dict[str, str]:
+    """Extract face id -> name map from face info response."""
+    if not isinstance(data, dict):
+        return {}
+
+    result = data.get("result")
+    if isinstance(result, dict):
+        face_list = result.get("faceList") or result.get("list") or []
+    elif isinstance(result, list):
+        face_list = result
+    else:
+        face_list = data.get("faceList") or data.get("list") or []
+
+    face_map: dict[str, str] = {}
+    if isinstance(face_list, list):
+        for item in face_list:
+            if not isinstance(item, dict):
+                continue
+            face_id = item.get("faceId") or item.get("id")
+            face_id_str = item.get("faceIdStr")
+            name = item.get("name") or item.get("faceName")
+            if name:
+                if face_id:
+                    face_map[str(face_id)] = str(name)
+                if face_id_str:
+                    face_map[str(face_id_str)] = str(name)
+    return face_map
+
+
+def parse_history_list(data: dict | None) -> list:
+    """Extract the list of records from a history log response."""
+    if not isinstance(data, dict):
+        return []
+
+    result = data.get("result")
+    if isinstance(result, dict):
+        history_list = (
+            result.get("data")
+            or result.get("history")
+            or result.get("list")
+            or result.get("resultList")
+            or []
+        )
+    elif isinstance(result, list):
+        history_list = result
+    else:
+        history_list = data.get("history") or data.get("list") or []
+
+    return history_list if isinstance(history_list, list) else []
+
+
+def parse_scan_id(data: dict | None) -> str | None:
+    """Extract the paging cursor from a history log response."""
+    if not isinstance(data, dict):
+        return None
+
+    result = data.get("result")
+    scan_id = result.get("scanId") if isinstance(result, dict) else None
+    if not scan_id:
+        scan_id = data.get("scanId")
+    return str(scan_id) if scan_id else None
+
+
+def parse_record_face_id(item: object) -> str | None:
+    """Extract the face id from a single history record."""
+    if not isinstance(item, dict):
+        return None
+    return (
+        item.get("faceId")
+        or item.get("faceIdStr")
+        or item.get("value")
+        or item.get("data")
+        or item.get("attrValue")
+    )
+
+
+def parse_record_ts(item: object) -> int | None:
+    """Extract the timestamp (ms) from a single history record."""
+    if not isinstance(item, dict):
+        return None
+    ts = item.get("timeStamp") or item.get("timestamp")
+    if isinstance(ts, (int, float)):
+        return int(ts)
+    return None
+
+
+def parse_record_resource_id(item: object) -> str | None:
+    """Extract the resource id from a single history record."""
+    if not isinstance(item, dict):
+        return None
+    resource_id = item.get("resourceId") or item.get("resId")
+    return str(resource_id) if resource_id else None
+
+
+def parse_event_resources(text: str) -> dict[str, str]:
+    """Parse "type=resource_id, ..." into an event type -> resource id map.
+
+    Raises ValueError on a malformed or unknown entry.
+    """
+    resources: dict[str, str] = {}
+    for part in text.replace("\n", ",").split(","):
+        if not part.strip():
+            continue
+        event_type, sep, resource_id = part.partition("=")
+        event_type = event_type.strip().lower()
+        resource_id = resource_id.strip()
+        if not sep or event_type not in EVENT_TYPES or not resource_id:
+            raise ValueError(f"Invalid event resource: {part.strip()}")
+        resources[event_type] = resource_id
+    return resources
+
+
+def parse_last_face_id(data: dict | None) -> str | None:
+    """Extract the last face id from history log response."""
+    history_list = parse_history_list(data)
+    if history_list:
+        return parse_record_face_id(history_list[0])
+    return None
+
+
+def parse_last_face_ts(data: dict | None) -> int | None:
+    """Extract the timestamp (ms) of the last face event."""
+    history_list = parse_history_list(data)
+    if history_list:
+        return parse_record_ts(history_list[0])
+    return None
+
+
+def parse_device_list(data: dict | None) -> list[dict[str, Any]]:
+    """Extract device list from response."""
+    if not isinstance(data, dict):
+        return []
+    result = data.get("result")
+    if isinstance(result, dict):
+        for key in ("data", "list", "deviceList", "devices"):
+            value = result.get(key)
+            if isinstance(value, list):
+                return value
+    if isinstance(result, list):
+        return result
+    for key in ("data", "list", "deviceList", "devices"):
+        value = data.get(key)
+        if isinstance(value, list):
+            return value
+    return []
+
+
+@dataclass(slots=True, frozen=True)
+class DeviceStatus:
+    """Resource attrs returned by a status query."""
+
+    attrs: Mapping[str, Any]
+
+    @classmethod
+    def from_response(cls, data: dict | None) -> DeviceStatus:
+        """Build from a /lumi/res/query response."""
+        return cls(MappingProxyType(parse_attr_map(data)))
+
+
+@dataclass(slots=True, frozen=True)
+class FaceInfo:
+    """Enrolled faces of a camera."""
+
+    faces: Mapping[str, str]
+
+    @classmethod
+    def from_response(cls, data: dict | None) -> FaceInfo:
+        """Build from a /lumi/devex/face/info response."""
+        return cls(MappingProxyType(parse_face_map(data)))
+
+
+@dataclass(slots=True, frozen=True)
+class HistoryRecord:
+    """A single history log record."""
+
+    face_id: str | None
+    ts: int | None
+    resource_id: str | None = None
+
+    @classmethod
+    def from_item(cls, item: object) -> HistoryRecord:
+        """Build from one history list item."""
+        face_id = parse_record_face_id(item)
+        return cls(
+            str(face_id) if face_id else None,
+            parse_record_ts(item),
+            parse_record_resource_id(item),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class HistoryPage:
+    """A page of history log records (newest first)."""
+
+    records: tuple[HistoryRecord, ...]
+    scan_id: str | None
+
+    @classmethod
+    def from_response(cls, data: dict | None) -> HistoryPage:
+        """Build from a /lumi/res/history/log response."""
+        return cls(
+            tuple(HistoryRecord.from_item(item) for item in parse_history_list(data)),
+            parse_scan_id(data),
+        )
+
+    @property
+    def latest(self) -> HistoryRecord | None:
+        """Return the newest record, if any."""
+        return self.records[0] if self.records else None
+
+    def latest_by_resource(
+        self, default_resource_id: str | None = None
+    ) -> dict[str, HistoryRecord]:
+        """Return the newest record of each resource id.
+
+        Records without a resource id are filed under default_resource_id.
+        """
+        latest: dict[str, HistoryRecord] = {}
+        for record in self.records:
+            resource_id = record.resource_id or default_resource_id
+            if resource_id is None:
+                continue
+            current = latest.get(resource_id)
+            if current is None or (record.ts or 0) > (current.ts or 0):
+                latest[resource_id] = record
+        return latest
+
+
+@dataclass(slots=True, frozen=True)
+class AqaraDevice:
+    """A device from the account device list."""
+
+    device_id: str
+    name: str | None
+
+    @classmethod
+    def from_item(cls, item: object) -> AqaraDevice | None:
+        """Build from one device list item, or None if it has no id."""
+        if not isinstance(item, dict):
+            return None
+        device_id = (
+            item.get("subjectId")
+            or item.get("deviceId")
+            or item.get("did")
+            or item.get("devId")
+            or item.get("id")
+        )
+        if not device_id:
+            return None
+        name = (
+            item.get("name")
+            or item.get("deviceName")
+            or item.get("positionName")
+            or item.get("model")
+        )
+        return cls(str(device_id), str(name) if name else None)
+
+
+def parse_devices(data: dict | None) -> tuple[AqaraDevice, ...]:
+    """Build typed devices from a device query response."""
+    devices = (AqaraDevice.from_item(item) for item in parse_device_list(data))
+    return tuple(device for device in devices if device is not None)
+
+
+@dataclass(slots=True, frozen=True)
+class FaceEvent:
+    """The last recognised face and who it maps to."""
+
+    face_id: str | None
+    ts: int | None
+    name: str | None = None
+    person: str | None = None
+
+
+_FACE_KEYS: dict[str, Callable[[FaceEvent], Any]] = {
+    "last_face_id": lambda face: face.face_id,
+    "last_face_ts": lambda face: face.ts,
+    "last_face_name": lambda face: face.name,
+    "last_face_person": lambda face: face.person,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class CameraSnapshot:
+    """Immutable view of a camera's state handed to entities.
+
+    fetched_at is left out of equality, so a poll that only confirms the
+    cached state compares equal and does not notify listeners.
+    """
+
+    status: Mapping[str, Any] = field(default_factory=lambda: _EMPTY)
+    face: FaceEvent | None = None
+    fetched_at: float = field(default=0.0, compare=False)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a status attr or last_face_* value by flat key."""
+        getter = _FACE_KEYS.get(key)
+        if getter is None:
+            return self.status.get(key, default)
+        if self.face is None:
+            return default
+        value = getter(self.face)
+        return default if value is None else value
+
+    def keys(self) -> Iterator[str]:
+        """Return the flat keys that currently have a value."""
+        yield from self.status
+        if self.face is not None:
+            yield from (key for key, getter in _FACE_KEYS.items() if getter(self.face) is not None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a flat attr -> value dict."""
+        return {key: self.get(key) for key in self.keys()}
@@ -0,0 +1,128 @@
+"""Face-based presence engine for Aqara Camera G3."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+import heapq
+import itertools
+import time
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DATA_PRESENCE
+
+
+@dataclass(slots=True, frozen=True)
+class Sighting:
+    """The latest sighting of a person."""
+
+    camera: str
+    ts: int
+    # Event loop time at which the sighting expires
+    expires: float
+    seq: int
+
+
+class PresenceEngine:
+    """Track which camera last saw each mapped person.
+
+    Sightings of every person on every camera share one expiry heap and a
+    single event loop timer, so the cost does not grow with the number of
+    persons. A person is only ever seen at the camera with the newest event.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty engine."""
+        self._hass = hass
+        self._sightings: dict[str, Sighting] = {}
+        # (expires, seq, person); stale entries are skipped when popped
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._listeners: dict[str, list[Callable[[], None]]] = {}
+
+    def sighting(self, person: str) -> Sighting | None:
+        """Return the active sighting of a person, if any."""
+        return self._sightings.get(person)
+
+    @callback
+    def async_seen(
+        self, person: str, camera: str, ts: int, hold: timedelta
+    ) -> None:
+        """Record that a camera saw a person at ts (ms)."""
+        current = self._sightings.get(person)
+        if current is not None and (
+            ts < current.ts or (ts == current.ts and camera == current.camera)
+        ):
+            # An older or repeated event, e.g. the same face on a slower camera
+            return
+        remaining = ts / 1000 + hold.total_seconds() - time.time()
+        if remaining <= 0:
+            return
+
+        seq = next(self._seq)
+        expires = self._hass.loop.time() + remaining
+        self._sightings[person] = Sighting(camera, ts, expires, seq)
+        heapq.heappush(self._heap, (expires, seq, person))
+        self._schedule()
+        self._notify(person)
+
+    @callback
+    def async_subscribe(
+        self, person: str, listener: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Call listener whenever the sighting of a person changes."""
+        self._listeners.setdefault(person, []).append(listener)
+
+        @callback
+        def _unsubscribe() -> None:
+            listeners = self._listeners.get(person, [])
+            listeners.remove(listener)
+            if not listeners:
+                self._listeners.pop(person, None)
+
+        return _unsubscribe
+
+    @callback
+    def _schedule(self) -> None:
+        """Point the single timer at the earliest expiry."""
+        if not self._heap:
+            return
+        when = self._heap[0][0]
+        if self._timer is not None:
+            if self._timer.when() <= when:
+                return
+            self._timer.cancel()
+        self._timer = self._hass.loop.call_at(when, self._expire)
+
+    @callback
+    def _expire(self) -> None:
+        """Drop every sighting whose hold time has passed."""
+        self._timer = None
+        now = self._hass.loop.time()
+        expired: list[str] = []
+        while self._heap and self._heap[0][0] <= now:
+            _, seq, person = heapq.heappop(self._heap)
+            current = self._sightings.get(person)
+            if current is not None and current.seq == seq:
+                del self._sightings[person]
+                expired.append(person)
+        self._schedule()
+        for person in expired:
+            self._notify(person)
+
+    @callback
+    def _notify(self, person: str) -> None:
+        """Call the listeners of a person."""
+        for listener in list(self._listeners.get(person, ())):
+            listener()
+
+
+@callback
+def async_get_presence_engine(hass: HomeAssistant) -> PresenceEngine:
+    """Return the presence engine shared by every camera."""
+    if DATA_PRESENCE not in hass.data:
+        hass.data[DATA_PRESENCE] = PresenceEngine(hass)
+    return hass.data[DATA_PRESENCE]
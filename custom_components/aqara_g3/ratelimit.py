@@ -0,0 +1,154 @@
+"""Per-region request rate limiting for Aqara Camera G3."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    CONF_AQARA_URL,
+    CONF_RATE_LIMIT,
+    DATA_RATE_LIMITERS,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    DOMAIN,
+)
+from .request_queue import PRIORITY_BACKGROUND
+
+_LOGGER = logging.getLogger(__name__)
+
+# Waits longer than this are logged
+SLOW_WAIT_THRESHOLD = 1.0
+
+
+class TokenBucket:
+    """Token bucket shared by every client talking to one region server.
+
+    Waiters get tokens by priority, then in arrival order, so an interactive
+    request overtakes background polls that are already waiting.
+    """
+
+    def __init__(self, name: str, rate: float, burst: int) -> None:
+        """Initialize the bucket full."""
+        self.name = name
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        # (priority, seq, future); cancelled waiters are skipped when popped
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._waiting = 0
+        self.last_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Return the refill rate in requests per second."""
+        return self._rate
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for a token."""
+        return self._waiting
+
+    @callback
+    def async_configure(self, rate: float, burst: int) -> None:
+        """Change the refill rate and burst size."""
+        self._refill()
+        self._rate = rate
+        self._burst = burst
+        self._tokens = min(self._tokens, float(burst))
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._waiters:
+            self._grant()
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self._burst), self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    @callback
+    def _grant(self) -> None:
+        """Hand out available tokens and wake up when the next one is due."""
+        self._timer = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        if self._waiters:
+            self._timer = asyncio.get_running_loop().call_later(
+                (1 - self._tokens) / self._rate, self._grant
+            )
+
+    async def acquire(self, priority: int = PRIORITY_BACKGROUND) -> float:
+        """Wait for a token and return how long the caller waited."""
+        start = time.monotonic()
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self._waiting += 1
+        try:
+            if self._timer is None:
+                self._grant()
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before the caller gave up; hand the token back
+                self._tokens += 1
+                if self._waiters and self._timer is None:
+                    self._grant()
+            raise
+        finally:
+            self._waiting -= 1
+
+        waited = time.monotonic() - start
+        self.last_wait = waited
+        self.max_wait = max(self.max_wait, waited)
+        if waited > SLOW_WAIT_THRESHOLD:
+            _LOGGER.debug(
+                "Rate limiter %s delayed request by %.2fs (queue depth %s)",
+                self.name,
+                waited,
+                self._waiting,
+            )
+        return waited
+
+
+@callback
+def async_get_rate_limiter(hass: HomeAssistant, aqara_url: str) -> TokenBucket:
+    """Return the shared token bucket for a region server."""
+    limiters: dict[str, TokenBucket] = hass.data.setdefault(DATA_RATE_LIMITERS, {})
+    if aqara_url not in limiters:
+        limiters[aqara_url] = TokenBucket(
+            aqara_url, DEFAULT_RATE_LIMIT, DEFAULT_RATE_BURST
+        )
+    return limiters[aqara_url]
+
+
+@callback
+def async_apply_rate_limit(hass: HomeAssistant, aqara_url: str) -> None:
+    """Configure a region bucket with the strictest limit of its entries."""
+    rates = [
+        entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT)
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.data.get(CONF_AQARA_URL) == aqara_url
+    ]
+    rate = min(rates, default=DEFAULT_RATE_LIMIT)
+    async_get_rate_limiter(hass, aqara_url).async_configure(
+        rate, max(1, min(DEFAULT_RATE_BURST, round(rate * 2)))
+    )
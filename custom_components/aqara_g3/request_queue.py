@@ -0,0 +1,140 @@
+"""Per-account priority request queue for Aqara Camera G3."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_REQUEST_QUEUES
+
+if TYPE_CHECKING:
+    from .ratelimit import TokenBucket
+
+_LOGGER = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+@dataclass(order=True)
+class _QueuedRequest:
+    """A request waiting for a concurrency slot."""
+
+    priority: int
+    seq: int
+    factory: Callable[[], Awaitable[Any]] = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    merge_key: Hashable | None = field(default=None, compare=False)
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    """Retrieve the exception so abandoned futures do not log warnings."""
+    if not future.cancelled():
+        future.exception()
+
+
+class RequestQueue:
+    """Run cloud requests by priority with bounded concurrency."""
+
+    def __init__(self, name: str, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> None:
+        """Initialize the queue."""
+        self.name = name
+        self._max_concurrency = max_concurrency
+        self._heap: list[_QueuedRequest] = []
+        self._pending: dict[Hashable, asyncio.Future] = {}
+        self._running: set[asyncio.Task] = set()
+        self._admitting: set[asyncio.Task] = set()
+        self._seq = itertools.count()
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for a slot."""
+        return len(self._heap)
+
+    async def run(
+        self,
+        priority: int,
+        factory: Callable[[], Awaitable[Any]],
+        merge_key: Hashable | None = None,
+        limiter: TokenBucket | None = None,
+    ) -> Any:
+        """Queue a request and return its result.
+
+        Requests with the same merge_key that are still queued share one call.
+        With a limiter, the request waits for its token before it queues for
+        a slot, so throttled requests never hold a slot while they sleep.
+        """
+        if merge_key is not None and merge_key in self._pending:
+            return await asyncio.shield(self._pending[merge_key])
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_consume_exception)
+        request = _QueuedRequest(priority, next(self._seq), factory, future, merge_key)
+        if merge_key is not None:
+            self._pending[merge_key] = future
+        if limiter is None:
+            self._enqueue(request)
+        else:
+            task = asyncio.create_task(self._admit(request, limiter))
+            self._admitting.add(task)
+            task.add_done_callback(self._admitting.discard)
+        return await asyncio.shield(future)
+
+    async def _admit(self, request: _QueuedRequest, limiter: TokenBucket) -> None:
+        """Queue a request for a slot once the limiter grants its token."""
+        await limiter.acquire(request.priority)
+        self._enqueue(request)
+
+    @callback
+    def _enqueue(self, request: _QueuedRequest) -> None:
+        """Queue a request for the next free slot."""
+        heapq.heappush(self._heap, request)
+        self._dispatch()
+
+    @callback
+    def _dispatch(self) -> None:
+        """Start queued requests while slots are free."""
+        while self._heap and len(self._running) < self._max_concurrency:
+            request = heapq.heappop(self._heap)
+            if request.merge_key is not None:
+                self._pending.pop(request.merge_key, None)
+            task = asyncio.create_task(self._execute(request))
+            self._running.add(task)
+            task.add_done_callback(self._on_done)
+
+    @callback
+    def _on_done(self, task: asyncio.Task) -> None:
+        """Free the slot of a finished request."""
+        self._running.discard(task)
+        self._dispatch()
+
+    async def _execute(self, request: _QueuedRequest) -> None:
+        """Run one request and resolve its future."""
+        try:
+            result = await request.factory()
+        except asyncio.CancelledError:
+            request.future.cancel()
+            raise
+        except Exception as err:  # pylint: disable=broad-except
+            if not request.future.done():
+                request.future.set_exception(err)
+        else:
+            if not request.future.done():
+                request.future.set_result(result)
+
+
+@callback
+def async_get_request_queue(hass: HomeAssistant, account: str) -> RequestQueue:
+    """Return the shared request queue for an Aqara account."""
+    queues: dict[str, RequestQueue] = hass.data.setdefault(DATA_REQUEST_QUEUES, {})
+    if account not in queues:
+        queues[account] = RequestQueue(account)
+    return queues[account]
@@ -0,0 +1,146 @@
+"""Integration-wide poll scheduler for Aqara Camera G3."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import random
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DATA_SCHEDULER
+
+_LOGGER = logging.getLogger(__name__)
+
+# Jitter is a fraction of the gap between neighbouring phases, capped in seconds
+JITTER_FRACTION = 0.1
+JITTER_MAX = 2.0
+
+
+@dataclass
+class _PollJob:
+    """A registered periodic poll."""
+
+    key: str
+    interval: float
+    action: Callable[[], Coroutine[Any, Any, Any]]
+    phase: float = 0.0
+    jitter: float = 0.0
+    handle: asyncio.TimerHandle | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+
+class PollScheduler:
+    """Spread polls with the same interval evenly across that interval."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._jobs: dict[str, _PollJob] = {}
+        self._epoch = hass.loop.time()
+
+    @callback
+    def async_register(
+        self,
+        key: str,
+        interval: timedelta,
+        action: Callable[[], Coroutine[Any, Any, Any]],
+    ) -> CALLBACK_TYPE:
+        """Register a periodic poll and return a callback that removes it."""
+        self.async_unregister(key)
+        self._jobs[key] = _PollJob(key, interval.total_seconds(), action)
+        self._rebalance(self._jobs[key].interval)
+
+        @callback
+        def _unregister() -> None:
+            self.async_unregister(key)
+
+        return _unregister
+
+    @callback
+    def async_unregister(self, key: str) -> None:
+        """Remove a poll, cancel its running refresh and re-balance the rest."""
+        job = self._jobs.pop(key, None)
+        if job is None:
+            return
+        if job.handle:
+            job.handle.cancel()
+        if job.task and not job.task.done():
+            job.task.cancel()
+        self._rebalance(job.interval)
+
+    @callback
+    def async_set_interval(self, key: str, interval: timedelta) -> None:
+        """Move a poll to a different interval."""
+        job = self._jobs.get(key)
+        seconds = interval.total_seconds()
+        if job is None or job.interval == seconds:
+            return
+        old_interval = job.interval
+        job.interval = seconds
+        self._rebalance(old_interval)
+        self._rebalance(seconds)
+
+    @callback
+    def _rebalance(self, interval: float) -> None:
+        """Assign evenly spaced phases to every job sharing an interval."""
+        group = sorted(
+            (job for job in self._jobs.values() if job.interval == interval),
+            key=lambda job: job.key,
+        )
+        if not group:
+            return
+        spacing = interval / len(group)
+        jitter = min(JITTER_MAX, spacing * JITTER_FRACTION)
+        for index, job in enumerate(group):
+            job.phase = index * spacing
+            job.jitter = jitter
+            self._schedule(job)
+        _LOGGER.debug(
+            "Re-balanced %s polls at %ss interval (spacing %.2fs)",
+            len(group),
+            interval,
+            spacing,
+        )
+
+    @callback
+    def _schedule(self, job: _PollJob) -> None:
+        """Schedule the next run of a job at its phase in the next cycle."""
+        if job.handle:
+            job.handle.cancel()
+        now = self._hass.loop.time()
+        # Look past the jitter window so an early run never repeats its own slot
+        elapsed = now + job.jitter - self._epoch - job.phase
+        cycle = math.floor(elapsed / job.interval) + 1
+        when = self._epoch + job.phase + cycle * job.interval
+        when += random.uniform(-job.jitter, job.jitter)
+        if when <= now:
+            when += job.interval
+        job.handle = self._hass.loop.call_at(when, self._run, job)
+
+    @callback
+    def _run(self, job: _PollJob) -> None:
+        """Start a poll unless the previous one is still running."""
+        job.handle = None
+        if self._jobs.get(job.key) is not job:
+            return
+        if job.task is None or job.task.done():
+            # Background tasks do not hold up Home Assistant shutdown
+            job.task = self._hass.async_create_background_task(
+                job.action(), f"aqara_g3_poll_{job.key}"
+            )
+        else:
+            _LOGGER.debug("Skipping poll for %s, previous run still active", job.key)
+        self._schedule(job)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the shared poll scheduler."""
+    if DATA_SCHEDULER not in hass.data:
+        hass.data[DATA_SCHEDULER] = PollScheduler(hass)
+    return hass.data[DATA_SCHEDULER]
@@ -3,25 +3,52 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import deque
+from datetime import timedelta
+from statistics import median
+from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .auth import area_for_url
+from .const import (
+    CONF_AQARA_URL,
+    CONF_RSSI_DEADBAND,
+    CONF_RSSI_REPORT_INTERVAL,
+    CONF_RSSI_WINDOW,
+    DEFAULT_RSSI_DEADBAND,
+    DEFAULT_RSSI_REPORT_INTERVAL,
+    DEFAULT_RSSI_WINDOW,
+    DOMAIN,
+    LANE_EVENT,
+    LANE_STATUS,
+)
 from .coordinator import AqaraG3DataUpdateCoordinator
+from .entity import AqaraG3Entity
 
 _LOGGER = logging.getLogger(__name__)
 
-# Sensor type mapping: sensor_key -> (api_key, value_type)
-SENSOR_TYPES: dict[str, tuple[str, type[bool] | type[int] | type[str]]] = {
-    "wifi_rssi": ("device_wifi_rssi", int),
-    "alarm_status": ("alarm_status", bool),
-    "last_face_name": ("last_face_name", str),
-    "last_face_person": ("last_face_person", str),
+# Rate limiter sensors: sensor_key -> name
+RATE_LIMIT_SENSORS = {
+    "api_queue_depth": "API Queue Depth",
+    "api_wait_time": "API Wait Time",
+}
+# How often the rate limiter sensors sample their region's limiter
+RATE_LIMIT_SCAN_INTERVAL = timedelta(seconds=10)
+
+# Sensor type mapping: sensor_key -> (api_key, value_type, lane)
+SENSOR_TYPES: dict[str, tuple[str, type[bool] | type[int] | type[str], str]] = {
+    "wifi_rssi": ("device_wifi_rssi", int, LANE_STATUS),
+    "alarm_status": ("alarm_status", bool, LANE_STATUS),
+    "last_face_name": ("last_face_name", str, LANE_EVENT),
+    "last_face_person": ("last_face_person", str, LANE_EVENT),
 }
 
 
@@ -43,18 +70,49 @@ async def async_setup_entry(
         return
 
     sensors = [
-        AqaraG3Sensor(coordinator, "wifi_rssi", "WiFi RSSI", "mdi:wifi"),
+        AqaraG3RssiSensor(coordinator, "wifi_rssi", "WiFi RSSI", "mdi:wifi"),
         AqaraG3Sensor(coordinator, "alarm_status", "Alarm Status", "mdi:alarm"),
         AqaraG3Sensor(coordinator, "last_face_name", "Last Face", "mdi:account-box"),
         AqaraG3Sensor(coordinator, "last_face_person", "Last Face Person", "mdi:account-badge"),
     ]
 
+    # The limiter is shared by the region, so only one camera exposes it
+    registry = er.async_get(hass)
+    for key in RATE_LIMIT_SENSORS:
+        # Drop the per-camera copies created by earlier versions
+        if entity_id := registry.async_get_entity_id(
+            "sensor", DOMAIN, f"{entry.entry_id}_{key}"
+        ):
+            registry.async_remove(entity_id)
+    if _is_region_owner(hass, entry):
+        sensors.extend(
+            AqaraG3RateLimitSensor(coordinator, key, name)
+            for key, name in RATE_LIMIT_SENSORS.items()
+        )
+
     async_add_entities(sensors, update_before_add=True)
 
 
-class AqaraG3Sensor(CoordinatorEntity, SensorEntity):
+def _is_region_owner(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Return True if the entry hosts its region's rate limiter sensors.
+
+    The owner is the enabled entry of the region with the lowest entry id,
+    so it stays the same across restarts.
+    """
+    aqara_url = entry.data[CONF_AQARA_URL]
+    return entry.entry_id == min(
+        other.entry_id
+        for other in hass.config_entries.async_entries(DOMAIN)
+        if other.disabled_by is None and other.data.get(CONF_AQARA_URL) == aqara_url
+    )
+
+
+class AqaraG3Sensor(AqaraG3Entity, SensorEntity):
     """Representation of an Aqara Camera G3 sensor."""
 
+    # Change on every face event; keep them out of the recorder
+    _unrecorded_attributes = frozenset({"face_id", "last_seen"})
+
     def __init__(
         self,
         coordinator: AqaraG3DataUpdateCoordinator,
@@ -63,95 +121,165 @@ class AqaraG3Sensor(CoordinatorEntity, SensorEntity):
         icon: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._sensor_key = sensor_key
-        self._api_key, self._value_type = SENSOR_TYPES.get(
-            sensor_key, ("", str)
-        )
+        api_key, value_type, lane = SENSOR_TYPES.get(sensor_key, ("", str, LANE_STATUS))
+        super().__init__(coordinator, sensor_key, api_key, value_type, lane)
         self._attr_name = f"Aqara G3 {sensor_name}"
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{sensor_key}"
         self._attr_icon = icon
-        self._logged_no_data = False
+        self._expires = sensor_key in ("last_face_name", "last_face_person")
+
         if sensor_key == "wifi_rssi":
             self._attr_native_unit_of_measurement = "dBm"
             self._attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name="Aqara Camera G3",
-            manufacturer="Aqara",
-            model="Camera G3",
-            configuration_url="https://home.aqara.com",
-        )
-
     @property
     def native_value(self) -> bool | int | str | None:
         """Return the state of the sensor with correct type."""
-        if self.coordinator.data is None:
+        # Last face sensors are cleared by the coordinator's expiry timer
+        if self._expires and not self.hub.face_active:
             return None
+        return self._get_value()
 
-        if not self._api_key:
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the face id and time of the last face event."""
+        if not self._expires or not self.hub.face_active:
             return None
+        data = self.coordinator.data
+        face_ts = data.get("last_face_ts") if data is not None else None
+        return {
+            "face_id": data.get("last_face_id") if data is not None else None,
+            "last_seen": (
+                dt_util.utc_from_timestamp(face_ts / 1000).isoformat()
+                if face_ts
+                else None
+            ),
+        }
 
-        # Coordinator returns a normalized attr->value dict
-        try:
-            data = self.coordinator.data
-            if not isinstance(data, dict):
-                return None
-
-            value = data.get(self._api_key)
-            if value is None:
-                if not self._logged_no_data:
-                    _LOGGER.debug(
-                        "Missing api key '%s' for %s. Available keys: %s",
-                        self._api_key,
-                        self._sensor_key,
-                        list(data.keys()),
-                    )
-                    self._logged_no_data = True
-                return None
-            # Reset log flag when data becomes available again
-            self._logged_no_data = False
-
-            # Expire last face sensors after 5 minutes
-            if self._sensor_key in ("last_face_name", "last_face_person"):
-                ts_ms = data.get("last_face_ts")
-                if isinstance(ts_ms, (int, float)):
-                    if (time.time() * 1000) - ts_ms > 5 * 60 * 1000:
-                        return None
-
-            if value is None:
-                return None
-
-            # Convert value to correct type
-            try:
-                if self._value_type == bool:
-                    # Handle "0"/"1", 0/1, "true"/"false", True/False
-                    if isinstance(value, bool):
-                        return value
-                    if isinstance(value, str):
-                        return value.lower() in ("1", "true", "yes", "on")
-                    return bool(value)
-                elif self._value_type == int:
-                    return int(value)
-                elif self._value_type == str:
-                    return str(value)
-                else:
-                    return value
-            except (ValueError, TypeError) as err:
-                _LOGGER.debug(
-                    "Error converting value %s to %s for %s: %s",
-                    value,
-                    self._value_type.__name__,
-                    self._sensor_key,
-                    err,
-                )
-                return None
-
-        except (KeyError, TypeError, IndexError) as err:
-            _LOGGER.debug("Error parsing sensor data for %s: %s", self._sensor_key, err)
-            return None
 
+class AqaraG3RssiSensor(AqaraG3Sensor):
+    """WiFi RSSI sensor that filters jitter before writing state.
+
+    Readings go through a rolling median. The state is only written when
+    the filtered value moves by at least the deadband, and optionally no
+    more often than the report interval.
+    """
+
+    def __init__(
+        self,
+        coordinator: AqaraG3DataUpdateCoordinator,
+        sensor_key: str,
+        sensor_name: str,
+        icon: str,
+    ) -> None:
+        """Initialize the sensor and its filter."""
+        super().__init__(coordinator, sensor_key, sensor_name, icon)
+        options = coordinator.config_entry.options
+        self._deadband = options.get(CONF_RSSI_DEADBAND, DEFAULT_RSSI_DEADBAND)
+        self._samples: deque[int] = deque(
+            maxlen=options.get(CONF_RSSI_WINDOW, DEFAULT_RSSI_WINDOW)
+        )
+        self._report_interval = timedelta(
+            minutes=options.get(
+                CONF_RSSI_REPORT_INTERVAL, DEFAULT_RSSI_REPORT_INTERVAL
+            )
+        ).total_seconds()
+        self._reported: int | None = None
+        self._reported_at: float | None = None
+        self._reported_available: bool | None = None
+        self._sampled_at: float | None = None
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the last reported (filtered) RSSI."""
+        return self._reported
+
+    async def async_added_to_hass(self) -> None:
+        """Seed the filter with the current reading."""
+        await super().async_added_to_hass()
+        self._update_filter(force=True)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the filtered RSSI or availability changed."""
+        if self._update_filter():
+            super()._handle_coordinator_update()
+
+    def _update_filter(self, force: bool = False) -> bool:
+        """Feed the latest reading and return True if state should be written."""
+        value = self._get_value()
+        # Other attrs' pushes and writes notify too; only sample new readings
+        received_at = self.hub.attr_received_at(self._api_key)
+        if value is not None and received_at != self._sampled_at:
+            self._samples.append(value)
+            self._sampled_at = received_at
+        filtered = round(median(self._samples)) if self._samples else None
+
+        now = time.monotonic()
+        available = self.available
+        if force or available != self._reported_available or self._reported is None:
+            changed = True
+        elif filtered is None or abs(filtered - self._reported) < self._deadband:
+            changed = False
+        else:
+            changed = (
+                self._reported_at is None
+                or now - self._reported_at >= self._report_interval
+            )
+        if changed:
+            self._reported = filtered
+            self._reported_at = now
+            self._reported_available = available
+        return changed
+
+
+class AqaraG3RateLimitSensor(AqaraG3Entity, SensorEntity):
+    """Diagnostic sensor exposing the shared region rate limiter.
+
+    The limiter changes with every request of the region, so it is sampled
+    on its own interval rather than only on this camera's status updates.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:speedometer"
+
+    def __init__(
+        self,
+        coordinator: AqaraG3DataUpdateCoordinator,
+        sensor_key: str,
+        sensor_name: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, sensor_key)
+        aqara_url = coordinator.config_entry.data[CONF_AQARA_URL]
+        self._attr_unique_id = f"{DOMAIN}_{aqara_url}_{sensor_key}"
+        self._attr_name = f"Aqara G3 {area_for_url(aqara_url)} {sensor_name}"
+        if sensor_key == "api_wait_time":
+            self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
+            self._attr_suggested_display_precision = 2
+
+    async def async_added_to_hass(self) -> None:
+        """Start sampling the limiter."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_sample, RATE_LIMIT_SCAN_INTERVAL
+            )
+        )
+
+    @callback
+    def _async_sample(self, _now: Any) -> None:
+        """Write the state if the limiter value changed."""
+        if self.native_value != self.state:
+            self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the limiter queue depth or last wait time."""
+        limiter = self.hub.api.limiter
+        if limiter is None:
+            return None
+        if self._key == "api_queue_depth":
+            return limiter.queue_depth
+        return limiter.last_wait
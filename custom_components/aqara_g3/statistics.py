@@ -0,0 +1,211 @@
+"""Long-term face detection statistics for Aqara Camera G3."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+from .models import HistoryPage
+
+if TYPE_CHECKING:
+    from .coordinator import AqaraG3DataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+BACKFILL_DAYS = 30
+HISTORY_PAGE_SIZE = 100
+HISTORY_MAX_PAGES = 50
+UNKNOWN_FACE = "unknown"
+
+
+def _hour_start(ts_ms: int) -> datetime:
+    """Return the UTC start of the hour containing a ms timestamp."""
+    return dt_util.utc_from_timestamp(ts_ms / 1000).replace(
+        minute=0, second=0, microsecond=0
+    )
+
+
+class AqaraG3FaceStatistics:
+    """Maintain hourly per-person face detection counts as external statistics."""
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: AqaraG3DataUpdateCoordinator
+    ) -> None:
+        """Initialize the statistics writer."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self._subject_id = slugify(str(coordinator.config_entry.data["subject_id"]))
+        # statistic_id -> {hour start -> count} for hours not yet finalized
+        self._counts: dict[str, dict[datetime, int]] = defaultdict(dict)
+        # statistic_id -> cumulative sum before the oldest hour in _counts
+        self._base_sums: dict[str, float] = {}
+        self._watermark: int | None = None
+        self._ready = False
+        self._lock = asyncio.Lock()
+
+    def statistic_id(self, face_name: str) -> str:
+        """Return the external statistic id for a face name."""
+        return f"{DOMAIN}:face_{self._subject_id}_{slugify(face_name)}"
+
+    async def async_backfill(self) -> None:
+        """Import counts from the face history log since the last stored hour."""
+        face_names = set(self.coordinator.face_names) | {UNKNOWN_FACE}
+        last_rows = {
+            name: await self._async_get_last_row(self.statistic_id(name))
+            for name in face_names
+        }
+
+        default_start = dt_util.utcnow() - timedelta(days=BACKFILL_DAYS)
+        starts = [row[0] for row in last_rows.values() if row is not None]
+        start = min(starts) if len(starts) == len(last_rows) else default_start
+        start_ms = int(start.timestamp() * 1000)
+
+        for name, row in last_rows.items():
+            statistic_id = self.statistic_id(name)
+            if row is None:
+                self._base_sums[statistic_id] = 0.0
+            else:
+                row_start, row_state, row_sum = row
+                # The last stored hour is recounted, so start from the sum before it
+                self._base_sums[statistic_id] = row_sum - row_state
+                self._counts[statistic_id].setdefault(row_start, 0)
+
+        records = await self._async_fetch_since(start_ms)
+        for name, ts in records:
+            statistic_id = self.statistic_id(name)
+            self._base_sums.setdefault(statistic_id, 0.0)
+            hour = _hour_start(ts)
+            last = last_rows.get(name)
+            if last is not None and hour < last[0]:
+                continue
+            counts = self._counts[statistic_id]
+            counts[hour] = counts.get(hour, 0) + 1
+
+        self._watermark = max((ts for _, ts in records), default=start_ms)
+        self._ready = True
+        self._async_import(set(self._counts))
+        _LOGGER.debug(
+            "Backfilled %s face events into %s statistics", len(records), len(self._counts)
+        )
+
+    async def async_process_new_events(self) -> None:
+        """Fetch events newer than the watermark and update their hours."""
+        if not self._ready or self._watermark is None:
+            return
+
+        async with self._lock:
+            try:
+                records = await self._async_fetch_since(self._watermark + 1)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Failed to fetch new face events: %s", err)
+                return
+            if records:
+                self._async_add_records(records)
+
+    def _async_add_records(self, records: list[tuple[str, int]]) -> None:
+        """Add newly fetched events to their hourly buckets."""
+        touched: set[str] = set()
+        for name, ts in records:
+            statistic_id = self.statistic_id(name)
+            self._base_sums.setdefault(statistic_id, 0.0)
+            counts = self._counts[statistic_id]
+            hour = _hour_start(ts)
+            counts[hour] = counts.get(hour, 0) + 1
+            touched.add(statistic_id)
+        self._watermark = max(ts for _, ts in records)
+        self._async_import(touched)
+
+    async def _async_fetch_since(self, start_ms: int) -> list[tuple[str, int]]:
+        """Page through the history log and return (face name, ts) pairs."""
+        coordinator = self.coordinator
+        face_map = coordinator.face_map
+        records: list[tuple[str, int]] = []
+        scan_id = ""
+
+        for _ in range(HISTORY_MAX_PAGES):
+            page = await coordinator.api.get_face_history(
+                size=HISTORY_PAGE_SIZE, start_time=start_ms, scan_id=scan_id
+            )
+            history = HistoryPage.from_response(page)
+            for record in history.records:
+                if record.ts is None or record.ts < start_ms:
+                    continue
+                name = face_map.get(record.face_id) if record.face_id else None
+                records.append((name or UNKNOWN_FACE, record.ts))
+
+            if len(history.records) < HISTORY_PAGE_SIZE or not history.scan_id:
+                break
+            scan_id = history.scan_id
+        else:
+            _LOGGER.debug("Face history paging stopped after %s pages", HISTORY_MAX_PAGES)
+
+        return records
+
+    async def _async_get_last_row(
+        self, statistic_id: str
+    ) -> tuple[datetime, float, float] | None:
+        """Return (start, state, sum) of the newest stored row, if any."""
+        result = await get_instance(self.hass).async_add_executor_job(
+            get_last_statistics, self.hass, 1, statistic_id, True, {"state", "sum"}
+        )
+        rows = result.get(statistic_id)
+        if not rows:
+            return None
+        row = rows[0]
+        start = row["start"]
+        if not isinstance(start, datetime):
+            start = dt_util.utc_from_timestamp(start)
+        return start, float(row.get("state") or 0), float(row.get("sum") or 0)
+
+    def _async_import(self, statistic_ids: set[str]) -> None:
+        """Write the pending hours for the given statistics and fold old ones."""
+        current_hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        names = {self.statistic_id(name): name for name in self.coordinator.face_names}
+        names.setdefault(self.statistic_id(UNKNOWN_FACE), UNKNOWN_FACE)
+
+        for statistic_id in statistic_ids:
+            counts = self._counts.get(statistic_id)
+            if not counts:
+                continue
+
+            running = self._base_sums.get(statistic_id, 0.0)
+            rows: list[StatisticData] = []
+            for hour in sorted(counts):
+                running += counts[hour]
+                rows.append(
+                    StatisticData(start=hour, state=counts[hour], sum=running)
+                )
+
+            metadata = StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=f"Aqara G3 face detections {names.get(statistic_id, statistic_id)}",
+                source=DOMAIN,
+                statistic_id=statistic_id,
+                unit_of_measurement=None,
+            )
+            async_add_external_statistics(self.hass, metadata, rows)
+
+            # Hours before the current one are final; keep only the newest
+            # row in memory so later events can be added on top of it.
+            finished = [hour for hour in counts if hour < current_hour]
+            keep = max(counts)
+            for hour in sorted(finished):
+                if hour == keep:
+                    continue
+                self._base_sums[statistic_id] = (
+                    self._base_sums.get(statistic_id, 0.0) + counts.pop(hour)
+                )
@@ -6,12 +6,11 @@ import logging
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import AqaraG3DataUpdateCoordinator
+from .entity import AqaraG3Entity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,7 +34,7 @@ async def async_setup_entry(
     async_add_entities([AqaraG3VideoSwitch(coordinator)], update_before_add=True)
 
 
-class AqaraG3VideoSwitch(CoordinatorEntity, SwitchEntity):
+class AqaraG3VideoSwitch(AqaraG3Entity, SwitchEntity):
     """Switch to control video on/off."""
 
     _attr_name = "Aqara G3 Video"
@@ -43,49 +42,23 @@ class AqaraG3VideoSwitch(CoordinatorEntity, SwitchEntity):
 
     def __init__(self, coordinator: AqaraG3DataUpdateCoordinator) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_set_video"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name="Aqara Camera G3",
-            manufacturer="Aqara",
-            model="Camera G3",
-            configuration_url="https://home.aqara.com",
-        )
+        super().__init__(coordinator, "set_video", "set_video", bool)
 
     @property
     def is_on(self) -> bool | None:
         """Return True if video is enabled."""
-        data = self.coordinator.data
-        if not isinstance(data, dict):
-            return None
-
-        value = data.get("set_video")
-        if value is None:
-            return None
-
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value.lower() in ("1", "true", "yes", "on")
-        return bool(value)
+        return self._get_value()
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on video."""
         try:
-            await self.coordinator.api.set_video(True)
-            await self.coordinator.async_request_refresh()
+            await self.hub.async_write_resources({"set_video": 1})
         except Exception as err:
             _LOGGER.warning("Failed to turn on video: %s", err)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off video."""
         try:
-            await self.coordinator.api.set_video(False)
-            await self.coordinator.async_request_refresh()
+            await self.hub.async_write_resources({"set_video": 0})
         except Exception as err:
             _LOGGER.warning("Failed to turn off video: %s", err)
@@ -0,0 +1,156 @@
+"""Webhook push ingestion for Aqara Camera G3."""
+from __future__ import annotations
+
+import hmac
+import json
+import logging
+import time
+from collections.abc import Mapping
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .auth import area_for_url, sign_headers
+from .const import AQARA_AREA_MAP, CONF_WEBHOOK_ID, DOMAIN, FACE_EVENT_RESOURCE_ID
+from .coordinator import AqaraG3DataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Reject callbacks whose signed Time is further than this from our clock
+PUSH_MAX_CLOCK_SKEW = 300
+
+
+def verify_signature(
+    headers: dict[str, str] | Any, body: str, appid: str, appkey: str
+) -> bool:
+    """Verify a push callback signed with the same MD5 scheme as requests."""
+    sign = headers.get("Sign")
+    nonce = headers.get("Nonce")
+    timestamp = headers.get("Time")
+    if not sign or not nonce or not timestamp:
+        return False
+    if headers.get("Appid") != appid:
+        return False
+    try:
+        if abs(time.time() - int(timestamp) / 1000) > PUSH_MAX_CLOCK_SKEW:
+            return False
+    except ValueError:
+        return False
+
+    expected = sign_headers(
+        {
+            "Appid": appid,
+            "Nonce": nonce,
+            "Time": timestamp,
+            "RequestBody": body,
+            "Appkey": appkey,
+        }
+    )
+    return hmac.compare_digest(expected, sign.lower())
+
+
+def parse_push_payload(
+    payload: Any, subject_id: str, event_resources: Mapping[str, str] | None = None
+) -> tuple[dict[str, object], list[tuple[str, int]], dict[str, int]]:
+    """Split a push message into attrs, face events and detections for one device.
+
+    Detections are keyed "last_<type>_ts" for every non-face event resource.
+    """
+    attrs: dict[str, object] = {}
+    face_events: list[tuple[str, int]] = []
+    detections: dict[str, int] = {}
+    if not isinstance(payload, dict):
+        return attrs, face_events, detections
+
+    items = payload.get("data")
+    if isinstance(items, dict):
+        items = [items]
+    if not isinstance(items, list):
+        return attrs, face_events, detections
+
+    if event_resources is None:
+        event_resources = {"face": FACE_EVENT_RESOURCE_ID}
+    event_types = {
+        resource_id: event_type for event_type, resource_id in event_resources.items()
+    }
+
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        if str(item.get("subjectId") or item.get("did") or "") != subject_id:
+            continue
+
+        value = item.get("value")
+        event_type = event_types.get(item.get("resourceId"))
+        if event_type is not None:
+            ts = item.get("time") or item.get("timeStamp") or item.get("timestamp")
+            try:
+                ts_ms = int(ts) if ts is not None else int(time.time() * 1000)
+            except (TypeError, ValueError):
+                continue
+            if event_type != "face":
+                key = f"last_{event_type}_ts"
+                detections[key] = max(ts_ms, detections.get(key, 0))
+                continue
+            face_id = item.get("faceId") or item.get("faceIdStr") or value
+            if face_id:
+                face_events.append((str(face_id), ts_ms))
+            continue
+
+        attr = item.get("attr")
+        if attr:
+            attrs[str(attr)] = value
+
+    return attrs, face_events, detections
+
+
+@callback
+def async_register_webhook(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: AqaraG3DataUpdateCoordinator
+) -> None:
+    """Register the push webhook for a config entry."""
+    webhook_id = entry.data[CONF_WEBHOOK_ID]
+    subject_id = str(entry.data["subject_id"])
+    appid = entry.data["appid"]
+    appkey = AQARA_AREA_MAP[area_for_url(entry.data["aqara_url"])]["appkey"]
+
+    async def _handle_webhook(
+        hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response:
+        """Handle an Aqara message push callback."""
+        body = await request.text()
+        if not verify_signature(request.headers, body, appid, appkey):
+            _LOGGER.warning("Rejected Aqara push with invalid signature")
+            return web.Response(status=401)
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return web.Response(status=400)
+
+        attrs, face_events, detections = parse_push_payload(
+            payload, subject_id, coordinator.event_resources
+        )
+        if attrs or face_events or detections:
+            coordinator.async_handle_push(attrs, face_events, detections)
+        return web.json_response({"code": 0})
+
+    webhook.async_register(
+        hass, DOMAIN, entry.title, webhook_id, _handle_webhook
+    )
+    _LOGGER.debug(
+        "Aqara G3 push webhook registered at %s",
+        webhook.async_generate_url(hass, webhook_id),
+    )
+
+
+@callback
+def async_unregister_webhook(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Unregister the push webhook for a config entry."""
+    webhook_id = entry.data.get(CONF_WEBHOOK_ID)
+    if webhook_id:
+        webhook.async_unregister(hass, webhook_id)
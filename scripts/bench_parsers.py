@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Benchmark and fuzz the Aqara response parsers.
+
+Usage:
+    python scripts/bench_parsers.py [--fuzz N] [--seed SEED] [--json FILE]
+
+Generates every response shape the parsers in models.py accept, at a
+realistic and an extreme size, and times each parser on each shape.
+Then feeds the parsers random and mutated responses and reports any
+exception. Exits non-zero if a parser returned a wrong result or crashed.
+The optional JSON report can be kept to compare timings across changes.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import random
+import sys
+import timeit
+import traceback
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+MODELS_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "aqara_g3"
+    / "models.py"
+)
+
+# Item counts per size: attrs, faces, history records, devices
+SIZES = {
+    "realistic": {"attrs": 19, "faces": 50, "history": 100, "devices": 20},
+    "extreme": {"attrs": 2000, "faces": 5000, "history": 10000, "devices": 2000},
+}
+
+KNOWN_KEYS = (
+    "result", "resultList", "attr", "value", "faceList", "list", "faceId",
+    "faceIdStr", "id", "name", "faceName", "data", "history", "scanId",
+    "attrValue", "timeStamp", "timestamp", "deviceList", "devices",
+    "subjectId", "deviceId", "did", "devId", "deviceName", "positionName",
+    "model", "code",
+)
+
+
+def load_models() -> Any:
+    """Import models.py by path so Home Assistant is not required."""
+    spec = importlib.util.spec_from_file_location("aqara_g3_models", MODELS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    # dataclasses looks the module up while building slotted classes
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# --- shape generators: each returns (response, expected item count) ---
+
+
+def attr_shapes(count: int) -> dict[str, tuple[dict, int]]:
+    """Return every supported resource query response shape."""
+    pairs = [{"attr": f"attr_{i}", "value": str(i % 2)} for i in range(count)]
+    keyed = {f"attr_{i}": {"value": str(i % 2)} for i in range(count)}
+    return {
+        "result_list": ({"code": 0, "result": pairs}, count),
+        "result_list_of_maps": ({"result": {"resultList": [keyed]}}, count),
+        "result_result_list": ({"result": {"resultList": pairs}}, count),
+        "result_map": ({"result": keyed}, count),
+        "top_level_result_list": ({"resultList": pairs}, count),
+    }
+
+
+def face_shapes(count: int) -> dict[str, tuple[dict, int]]:
+    """Return every supported face info response shape."""
+    faces = [
+        {"faceId": 1000 + i, "faceIdStr": f"f{i}", "name": f"Person {i % 500}"}
+        for i in range(count)
+    ]
+    alt_faces = [{"id": f"id{i}", "faceName": f"Person {i}"} for i in range(count)]
+    return {
+        "result_face_list": ({"result": {"faceList": faces}}, count * 2),
+        "result_list_key": ({"result": {"list": alt_faces}}, count),
+        "result_list": ({"result": faces}, count * 2),
+        "top_level_face_list": ({"faceList": faces}, count * 2),
+        "top_level_list": ({"list": alt_faces}, count),
+    }
+
+
+def history_shapes(count: int) -> dict[str, tuple[dict, int]]:
+    """Return every supported history log response shape."""
+    now = 1_700_000_000_000
+    records = [
+        {"resourceId": "13.95.85", "value": str(i % 50), "timeStamp": now - i * 1000}
+        for i in range(count)
+    ]
+    alt_records = [
+        {"faceIdStr": f"f{i}", "timestamp": now - i * 1000} for i in range(count)
+    ]
+    shapes = {
+        f"result_{key}": ({"result": {key: records, "scanId": "abc"}}, count)
+        for key in ("data", "history", "list", "resultList")
+    }
+    shapes["result_list"] = ({"result": alt_records}, count)
+    shapes["top_level_history"] = ({"history": records}, count)
+    shapes["top_level_list"] = ({"list": alt_records, "scanId": "abc"}, count)
+    return shapes
+
+
+def device_shapes(count: int) -> dict[str, tuple[dict, int]]:
+    """Return every supported device query response shape."""
+    id_keys = ("subjectId", "deviceId", "did", "devId", "id")
+    name_keys = ("name", "deviceName", "positionName", "model")
+    devices = [
+        {
+            id_keys[i % len(id_keys)]: f"lumi.{i:012x}",
+            name_keys[i % len(name_keys)]: f"Camera {i}",
+        }
+        for i in range(count)
+    ]
+    shapes = {
+        f"result_{key}": ({"result": {key: devices}}, count)
+        for key in ("data", "list", "deviceList", "devices")
+    }
+    shapes["result_list"] = ({"result": devices}, count)
+    shapes.update(
+        {f"top_level_{key}": ({key: devices}, count) for key in ("data", "devices")}
+    )
+    return shapes
+
+
+def parser_suite(models: Any) -> list[tuple[str, Callable, Callable, str]]:
+    """Return (name, parser, result length, shape kind) for every parser."""
+    return [
+        ("parse_attr_map", models.parse_attr_map, len, "attrs"),
+        ("DeviceStatus.from_response", models.DeviceStatus.from_response,
+         lambda result: len(result.attrs), "attrs"),
+        ("parse_face_map", models.parse_face_map, len, "faces"),
+        ("FaceInfo.from_response", models.FaceInfo.from_response,
+         lambda result: len(result.faces), "faces"),
+        ("parse_last_face_id", models.parse_last_face_id, None, "history"),
+        ("parse_last_face_ts", models.parse_last_face_ts, None, "history"),
+        ("HistoryPage.from_response", models.HistoryPage.from_response,
+         lambda result: len(result.records), "history"),
+        ("parse_device_list", models.parse_device_list, len, "devices"),
+        ("parse_devices", models.parse_devices, len, "devices"),
+    ]
+
+
+SHAPES = {
+    "attrs": attr_shapes,
+    "faces": face_shapes,
+    "history": history_shapes,
+    "devices": device_shapes,
+}
+
+
+def run_benchmarks(models: Any) -> tuple[list[dict[str, Any]], list[str]]:
+    """Time every parser on every shape and size, checking result sizes."""
+    results: list[dict[str, Any]] = []
+    errors: list[str] = []
+    for size_name, counts in SIZES.items():
+        for name, parser, measure, kind in parser_suite(models):
+            for shape, (response, expected) in SHAPES[kind](counts[kind]).items():
+                result = parser(response)
+                if measure is None:
+                    if result is None:
+                        errors.append(f"{name}/{shape}/{size_name}: got None")
+                elif measure(result) != expected:
+                    errors.append(
+                        f"{name}/{shape}/{size_name}: "
+                        f"expected {expected} items, got {measure(result)}"
+                    )
+                timer = timeit.Timer(lambda: parser(response))
+                # autorange finds a loop count taking ~0.2s; time 3 quarter runs
+                loops = max(1, timer.autorange()[0] // 4)
+                best = min(timer.repeat(repeat=3, number=loops)) / loops
+                results.append(
+                    {
+                        "parser": name,
+                        "shape": shape,
+                        "size": size_name,
+                        "items": counts[kind],
+                        "usec": round(best * 1e6, 2),
+                    }
+                )
+    return results, errors
+
+
+# --- fuzzing ---
+
+
+def random_value(rng: random.Random, depth: int = 0) -> Any:
+    """Return a random JSON value biased towards the keys parsers look for."""
+    choice = rng.random()
+    if depth > 4 or choice < 0.35:
+        return rng.choice(
+            [None, True, False, 0, -1, 1.5, 2**63, "", "x", "0", "1", [], {}]
+        )
+    if choice < 0.65:
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {
+        rng.choice(KNOWN_KEYS) if rng.random() < 0.8 else str(rng.random()):
+            random_value(rng, depth + 1)
+        for _ in range(rng.randint(0, 5))
+    }
+
+
+def mutate(rng: random.Random, value: Any) -> Any:
+    """Replace one random node of a valid response with a random value."""
+    if isinstance(value, dict) and value and rng.random() < 0.8:
+        key = rng.choice(list(value))
+        return {**value, key: mutate(rng, value[key])}
+    if isinstance(value, list) and value and rng.random() < 0.8:
+        index = rng.randrange(len(value))
+        return [*value[:index], mutate(rng, value[index]), *value[index + 1 :]]
+    return random_value(rng)
+
+
+def run_fuzz(models: Any, iterations: int, seed: int) -> list[str]:
+    """Feed random and mutated responses to every parser."""
+    rng = random.Random(seed)
+    seeds = [
+        response
+        for kind, shapes in SHAPES.items()
+        for response, _ in shapes(3).values()
+    ]
+    parsers = parser_suite(models)
+    failures: list[str] = []
+    for iteration in range(iterations):
+        if iteration % 2:
+            response = mutate(rng, rng.choice(seeds))
+        else:
+            response = random_value(rng)
+        for name, parser, _, _ in parsers:
+            try:
+                parser(response)
+            except Exception:  # pylint: disable=broad-except
+                failures.append(
+                    f"{name} crashed on iteration {iteration} (seed {seed}):\n"
+                    f"  input: {json.dumps(response, default=str)[:500]}\n"
+                    f"  {traceback.format_exc(limit=1).strip()}"
+                )
+    return failures
+
+
+def main() -> int:
+    """Run the benchmark and fuzz passes and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fuzz", type=int, default=5000, help="fuzz iterations")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="write timings to this file")
+    args = parser.parse_args()
+
+    models = load_models()
+    results, errors = run_benchmarks(models)
+
+    print(f"{'parser':<28} {'shape':<24} {'size':<10} {'items':>6} {'usec':>10}")
+    for row in results:
+        print(
+            f"{row['parser']:<28} {row['shape']:<24} {row['size']:<10} "
+            f"{row['items']:>6} {row['usec']:>10.2f}"
+        )
+
+    failures = run_fuzz(models, args.fuzz, args.seed)
+    print(f"\nfuzz: {args.fuzz} inputs, {len(failures)} crashes")
+    for message in errors + failures[:20]:
+        print(message)
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {"timings": results, "errors": errors, "crashes": len(failures)},
+                indent=2,
+            )
+            + "\n"
+        )
+    return 1 if errors or failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
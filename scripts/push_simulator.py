@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Post signed sample Aqara push messages to the integration webhook.
+
+Usage:
+    python scripts/push_simulator.py <webhook_url> <appid> <subject_id> [--face FACE_ID]
+
+Stands in for the Aqara cloud when testing push mode locally.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import time
+import urllib.request
+import uuid
+
+
+def sign(appid: str, nonce: str, timestamp: str, body: str, appkey: str) -> str:
+    """Sign a push body with the same MD5 scheme as the integration."""
+    source = f"Appid={appid}&Nonce={nonce}&Time={timestamp}&{body}&{appkey}"
+    return hashlib.md5(source.encode()).hexdigest()
+
+
+def post(url: str, appid: str, appkey: str, payload: dict) -> None:
+    """Send one signed payload and print the response."""
+    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    nonce = hashlib.md5(str(uuid.uuid4()).encode()).hexdigest()
+    timestamp = str(round(time.time() * 1000))
+    request = urllib.request.Request(
+        url,
+        data=body.encode(),
+        method="POST",
+        headers={
+            "Content-Type": "application/json",
+            "Appid": appid,
+            "Nonce": nonce,
+            "Time": timestamp,
+            "Sign": sign(appid, nonce, timestamp, body, appkey),
+        },
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        print(response.status, response.read().decode())
+
+
+def main() -> None:
+    """Send a resource report followed by a face event."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("url")
+    parser.add_argument("appid")
+    parser.add_argument("subject_id")
+    parser.add_argument("--appkey", default="NULL")
+    parser.add_argument("--face", default="1")
+    args = parser.parse_args()
+
+    now = int(time.time() * 1000)
+    post(
+        args.url,
+        args.appid,
+        args.appkey,
+        {
+            "msgType": "resource_report",
+            "data": [
+                {"subjectId": args.subject_id, "attr": "device_wifi_rssi", "value": -55, "time": now},
+                {"subjectId": args.subject_id, "attr": "set_video", "value": 1, "time": now},
+            ],
+        },
+    )
+    post(
+        args.url,
+        args.appid,
+        args.appkey,
+        {
+            "msgType": "event_log",
+            "data": [
+                {
+                    "subjectId": args.subject_id,
+                    "resourceId": "13.95.85",
+                    "value": args.face,
+                    "time": now,
+                }
+            ],
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()